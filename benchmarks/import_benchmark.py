@@ -0,0 +1,55 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = (
+    ('cli/crawl.py', ['cli/crawl.py', '--help']),
+    ('cli/graph.py', ['cli/graph.py', '--help']),
+    ('cli/convert.py', ['cli/convert.py', '--help']),
+    ('cli/reparse.py', ['cli/reparse.py', '--help']),
+    ('cli/cache.py', ['cli/cache.py', '--help']),
+    ('gui', ['-c', 'import gui.main_window']),
+)
+
+HEAVY_MODULES = ('matplotlib', 'numpy', 'bs4', 'lxml', 'requests', 'aiohttp', 'PyQt5', 'PIL')
+
+
+def run_once(args: list) -> tuple:
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT, QT_QPA_PLATFORM='offscreen')
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    elapsed = time.perf_counter() - started
+
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        module = line.rsplit('|', 1)[-1].strip()
+        top_level = module.split('.', 1)[0]
+        if top_level in HEAVY_MODULES:
+            imported.add(top_level)
+    return elapsed, sorted(imported)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-start import time of each entry point')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Runs per entry point (best is reported)')
+    args = parser.parse_args()
+
+    print(f"{'entry point':<16} {'best':>9}  heavy modules")
+    for name, entry_args in ENTRY_POINTS:
+        runs = [run_once(entry_args) for _ in range(args.repeat)]
+        best = min(elapsed for elapsed, _ in runs)
+        imported = runs[-1][1]
+        print(f"{name:<16} {best * 1000:7.1f}ms  {', '.join(imported) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
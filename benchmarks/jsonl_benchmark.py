@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.jsonl import JsonlReader
+from timestamp_benchmark import generate_jsonl
+
+
+def read_text_mode(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except Exception:
+                continue
+
+
+def measure(label: str, records, size: int) -> float:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = sum(1 for _ in records)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {count:>9} rows {elapsed:8.3f}s {size / elapsed / 2 ** 20:8.1f} MB/s  peak {peak / 1024:8.1f} KB")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Text-mode vs memory-mapped JSONL reading')
+    parser.add_argument('input', nargs='?', help='JSONL file (default: generated)')
+    parser.add_argument('-n', '--rows', type=int, default=500000, help='Rows to generate')
+    args = parser.parse_args()
+
+    tmp_dir = None
+    path = args.input
+    if not path:
+        tmp_dir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmp_dir.name, 'status.jsonl')
+        generate_jsonl(path, args.rows)
+
+    size = os.path.getsize(path)
+    print(f"file: {size / 2 ** 20:.1f} MB")
+    text_elapsed = measure("text mode", read_text_mode(path), size)
+    mmap_elapsed = measure("mmap", JsonlReader(path).read(), size)
+    print(f"speedup: {text_elapsed / mmap_elapsed:.2f}x")
+
+    if tmp_dir:
+        tmp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
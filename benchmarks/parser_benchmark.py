@@ -0,0 +1,111 @@
+import argparse
+import glob
+import gzip
+import json
+import os
+import sys
+import time
+from html import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.crawler import StatusPageParser, LxmlStatusPageParser
+
+
+ROW_TEMPLATE = (
+    '<tr id="solution-{submission_id}">'
+    '<td>{submission_id}</td>'
+    '<td><a href="/user/{user_id}" class="user">{user_id}</a></td>'
+    '<td><a href="/contest/problem/1/1" class="problem_title tooltip-click">{problem_no}</a></td>'
+    '<td class="result"><span class="result-text">{result}</span></td>'
+    '<td class="memory">{memory}</td>'
+    '<td class="time">{time}</td>'
+    '<td><a href="/source/{submission_id}">{language}</a><span> / </span><a href="/submit/1/{submission_id}">수정</a></td>'
+    '<td>{code_length}<span class="text-muted"> B</span></td>'
+    '<td><a href="" rel="tooltip" title="{submitted_at}" class="real-time-update">방금 전</a></td>'
+    '</tr>\n'
+)
+
+
+def load_corpus(corpus_dir: str):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, '**', '*.html*'), recursive=True)):
+        if path.endswith('.gz'):
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                pages.append(f.read())
+        elif path.endswith('.html'):
+            with open(path, 'r', encoding='utf-8') as f:
+                pages.append(f.read())
+    return pages
+
+
+def synthesize_corpus(jsonl_path: str, rows_per_page: int = 20):
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    pages = []
+    for start in range(0, len(records), rows_per_page):
+        chunk = records[start:start + rows_per_page]
+        rows = ''.join(ROW_TEMPLATE.format(
+            submission_id=r['submission_id'],
+            user_id=escape(r['user_id']),
+            problem_no=escape(r['problem_no']),
+            result=escape(r['result']),
+            memory='' if r['memory_kb'] is None else f"{r['memory_kb']}<span class=\"kb-text\"> KB</span>",
+            time='' if r['time_ms'] is None else f"{r['time_ms']}<span class=\"ms-text\"> ms</span>",
+            language=escape(r['language']),
+            code_length=r['code_length'],
+            submitted_at=r['submitted_at'],
+        ) for r in chunk)
+        next_link = ''
+        if start + rows_per_page < len(records):
+            next_link = f'<a id="next_page" href="/status?contest_id=1&amp;top={chunk[-1]["submission_id"] - 1}">다음 페이지</a>'
+        pages.append(
+            '<html><body><div class="table-responsive"><table id="status-table" class="table">'
+            '<thead><tr><th>제출 번호</th></tr></thead>'
+            f'<tbody>\n{rows}</tbody></table></div>{next_link}</body></html>'
+        )
+    return pages
+
+
+def run(parser, pages, repeat: int):
+    started = time.perf_counter()
+    results = None
+    for _ in range(repeat):
+        results = [parser.parse(page) for page in pages]
+    elapsed = time.perf_counter() - started
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='StatusPageParser backend conformance check and benchmark')
+    parser.add_argument('corpus', nargs='?', default='cache', help='Directory of saved status pages')
+    parser.add_argument('--synthetic', help='Build the corpus from a JSONL file instead of saved pages')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Repetitions over the corpus')
+    args = parser.parse_args()
+
+    pages = synthesize_corpus(args.synthetic) if args.synthetic else load_corpus(args.corpus)
+    if not pages:
+        print("No pages found")
+        return 1
+
+    backends = [('bs4', StatusPageParser()), ('lxml', LxmlStatusPageParser())]
+    outputs = {}
+    for name, backend in backends:
+        results, elapsed = run(backend, pages, args.repeat)
+        outputs[name] = results
+        total = len(pages) * args.repeat
+        print(f"{name:>5}: {total / elapsed:8.1f} pages/s ({elapsed:.3f}s for {total} pages)")
+
+    mismatches = [i for i, (a, b) in enumerate(zip(outputs['bs4'], outputs['lxml'])) if a != b]
+    rows = sum(len(submissions) for submissions, _ in outputs['bs4'])
+    if mismatches:
+        print(f"Conformance: FAILED on {len(mismatches)} of {len(pages)} pages (first: {mismatches[0]})")
+        return 1
+
+    print(f"Conformance: OK ({len(pages)} pages, {rows} rows identical)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+import argparse
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use('Agg')
+
+from services.graph_builder import (
+    GraphRenderer, PersistentGraphRenderer, SubmissionBinner, SubmissionRepository, TimeRange
+)
+
+
+def render_all(renderer: GraphRenderer, binned, time_range: TimeRange, output_dir: str) -> float:
+    started = time.perf_counter()
+    for group_index, problem_no in enumerate(binned.groups):
+        renderer.render(binned.to_bin_data(group_index), time_range, os.path.join(output_dir, f'{problem_no}.png'))
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GraphRenderer per-bin vs batched vs persistent figure benchmark')
+    parser.add_argument('input', nargs='?', default='status.jsonl', help='Input JSONL file')
+    parser.add_argument('--minute', type=int, default=1, help='Minute delta')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='Repetitions')
+    args = parser.parse_args()
+
+    table = SubmissionRepository.load_table(args.input)
+    time_range = TimeRange.from_timestamps(table.timestamps(), args.minute)
+    binned = SubmissionBinner(args.minute).bin_table(table)
+    problems = len(binned.groups)
+    print(f"problems: {problems}, bins: {len(binned.bin_starts)}")
+
+    with tempfile.TemporaryDirectory() as per_bin_dir, tempfile.TemporaryDirectory() as batched_dir, \
+            tempfile.TemporaryDirectory() as persistent_dir:
+        results = {}
+        for name, renderer, output_dir in (
+            ('per-bin', GraphRenderer(batched=False), per_bin_dir),
+            ('batched', GraphRenderer(batched=True), batched_dir),
+            ('persistent', PersistentGraphRenderer(), persistent_dir),
+        ):
+            elapsed = min(render_all(renderer, binned, time_range, output_dir) for _ in range(args.repeat))
+            results[name] = elapsed
+            print(f"{name:>10}: {elapsed / problems * 1000:8.1f} ms/problem")
+
+        identical = all(
+            filecmp.cmp(os.path.join(per_bin_dir, name), os.path.join(output_dir, name), shallow=False)
+            for output_dir in (batched_dir, persistent_dir)
+            for name in os.listdir(per_bin_dir)
+        )
+
+    print(f"speedup: batched {results['per-bin'] / results['batched']:.2f}x, "
+          f"persistent {results['per-bin'] / results['persistent']:.2f}x, identical output: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain import parse_timestamp
+from services.graph_builder import SubmissionBinner, SubmissionRepository, TimeRange
+
+RESULTS = ['맞았습니다!!', '틀렸습니다', '시간 초과', '메모리 초과', '런타임 에러', '컴파일 에러']
+
+
+def generate_jsonl(path: str, rows: int):
+    start = datetime(2024, 9, 28, 19, 0, 0)
+    rng = random.Random(0)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(rows):
+            submitted_at = (start + timedelta(seconds=rng.randrange(3 * 3600))).strftime('%Y-%m-%d %H:%M:%S')
+            f.write(
+                f'{{"submission_id": {100000000 - i}, "user_id": "user{rng.randrange(2000)}", '
+                f'"problem_no": "{chr(65 + rng.randrange(15))}", "result": "{rng.choice(RESULTS)}", '
+                f'"memory_kb": null, "time_ms": null, "language": "C++17", '
+                f'"source_url": "https://www.acmicpc.net/source/{100000000 - i}", '
+                f'"code_length": {rng.randrange(100, 5000)}, "submitted_at": "{submitted_at}"}}\n'
+            )
+
+
+def timed(label: str, fn):
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<40} {elapsed:8.3f}s")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Timestamp parsing benchmark')
+    parser.add_argument('input', nargs='?', help='JSONL file (default: generated)')
+    parser.add_argument('-n', '--rows', type=int, default=500000, help='Rows to generate')
+    args = parser.parse_args()
+
+    tmp_dir = None
+    path = args.input
+    if not path:
+        tmp_dir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmp_dir.name, 'status.jsonl')
+        generate_jsonl(path, args.rows)
+
+    submissions, _ = timed("load (parse once)", lambda: SubmissionRepository.load_from_jsonl(path))
+    texts = [s.submitted_at for s in submissions]
+    print(f"rows: {len(submissions)}")
+
+    _, strptime_elapsed = timed(
+        "datetime.strptime per row",
+        lambda: [datetime.strptime(t, '%Y-%m-%d %H:%M:%S') for t in texts]
+    )
+    _, fast_elapsed = timed("parse_timestamp per row", lambda: [parse_timestamp(t) for t in texts])
+
+    _, range_elapsed = timed("TimeRange.from_submissions", lambda: TimeRange.from_submissions(submissions))
+    _, bin_elapsed = timed("SubmissionBinner.bin_submissions", lambda: SubmissionBinner(3).bin_submissions(submissions))
+
+    legacy = 2 * strptime_elapsed
+    print(f"parser speedup: {strptime_elapsed / fast_elapsed:.1f}x")
+    print(f"consumer re-parse avoided: ~{legacy:.3f}s (time range + binning previously re-ran strptime)")
+    print(f"time range + binning now: {range_elapsed + bin_elapsed:.3f}s")
+
+    if tmp_dir:
+        tmp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
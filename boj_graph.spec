@@ -12,6 +12,11 @@ hiddenimports = [
     'bs4',
     'requests',
     'dotenv',
+    'lxml.html',
+    'gui.main_window',
+    'services.crawler',
+    'services.graph_builder',
+    'services.converter',
 ]
 
 tmp_ret = collect_all('matplotlib')
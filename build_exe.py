@@ -18,6 +18,11 @@ PyInstaller.__main__.run([
     '--hidden-import=bs4',
     '--hidden-import=requests',
     '--hidden-import=dotenv',
+    '--hidden-import=lxml.html',
+    '--hidden-import=gui.main_window',
+    '--hidden-import=services.crawler',
+    '--hidden-import=services.graph_builder',
+    '--hidden-import=services.converter',
     '--collect-all=matplotlib',
     '--collect-all=PyQt5',
     '--noupx',
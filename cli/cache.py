@@ -0,0 +1,35 @@
+import argparse
+from services.cache import CompressedCacheStrategy
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BOJ Page Cache Maintenance')
+    parser.add_argument('-d', '--cache-dir', default='cache', help='Cache directory')
+    parser.add_argument('--head-ttl', type=float, default=60, help='TTL for the live head page (seconds)')
+    parser.add_argument('--page-ttl', type=float, help='TTL for older pages (seconds, default: never)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('stats', help='Show cache statistics')
+
+    prune_parser = subparsers.add_parser('prune', help='Remove expired entries and evict to the size budget')
+    prune_parser.add_argument('--max-mb', type=int, default=512, help='Size budget in MB')
+    args = parser.parse_args()
+
+    cache = CompressedCacheStrategy(
+        cache_dir=args.cache_dir,
+        head_ttl=args.head_ttl,
+        page_ttl=args.page_ttl,
+        max_bytes=None
+    )
+
+    if args.command == 'stats':
+        stats = cache.stats()
+        print(f"Entries: {stats['entries']} (head: {stats['head_entries']}, expired: {stats['expired']})")
+        print(f"Size: {stats['bytes'] / (1024 * 1024):.2f} MB")
+    elif args.command == 'prune':
+        removed, freed = cache.prune(args.max_mb * 1024 * 1024)
+        print(f"Pruned {removed} entries, freed {freed / (1024 * 1024):.2f} MB")
+
+
+if __name__ == '__main__':
+    main()
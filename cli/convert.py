@@ -1,6 +1,9 @@
 import argparse
+import os
 from services import ConverterFactory
 
+FORMAT_EXTENSIONS = {'.parquet': 'parquet', '.arrow': 'arrow', '.feather': 'arrow'}
+
 
 def main():
     parser = argparse.ArgumentParser(description='JSONL to CSV Converter')
@@ -8,18 +11,26 @@ def main():
     parser.add_argument('-o', '--output', default='status.csv', help='Output CSV file')
     parser.add_argument('--fields', help='Comma-separated field names')
     parser.add_argument('-d', '--delimiter', default=',', help='CSV delimiter')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Parallel parsing processes')
+    parser.add_argument('--format', choices=['csv', 'parquet', 'arrow'],
+                        help='Output format (default: from output extension, otherwise csv)')
     args = parser.parse_args()
 
     fields = None
     if args.fields:
         fields = [f.strip() for f in args.fields.split(',') if f.strip()]
 
-    converter = ConverterFactory.create_jsonl_to_csv(
-        args.input,
-        args.output,
-        fields,
-        args.delimiter
-    )
+    file_format = args.format or FORMAT_EXTENSIONS.get(os.path.splitext(args.output)[1].lower(), 'csv')
+    if file_format == 'csv':
+        converter = ConverterFactory.create_jsonl_to_csv(
+            args.input,
+            args.output,
+            fields,
+            args.delimiter,
+            args.jobs
+        )
+    else:
+        converter = ConverterFactory.create_jsonl_to_columnar(args.input, args.output, fields, file_format)
     converter.convert()
 
     print(f"Conversion completed: {args.output}")
@@ -9,14 +9,33 @@ def main():
     parser.add_argument('-c', '--cookie', help='BOJ_AUTO_LOGIN cookie value')
     parser.add_argument('-m', '--max-pages', type=int, help='Maximum pages to crawl')
     parser.add_argument('--no-cache', action='store_true', help='Disable cache')
+    parser.add_argument('--cache-type', choices=['file', 'compressed', 'sqlite'], default='file', help='Page cache backend')
+    parser.add_argument('--cache-max-mb', type=int, help='Compressed cache size budget in MB')
+    parser.add_argument('--pool-size', type=int, default=10, help='HTTP connection pool size')
+    parser.add_argument('--retries', type=int, default=3, help='Retries on 429/5xx responses')
+    parser.add_argument('--backoff', type=float, default=0.5, help='Exponential backoff factor (seconds)')
+    parser.add_argument('--workers', type=int, default=1, help='Concurrent page fetch workers (1 = sequential)')
+    parser.add_argument('--rate', type=float, help='Maximum requests per second across all workers')
+    parser.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4', help='HTML parser backend')
+    parser.add_argument('--incremental', action='store_true', help='Fetch only submissions newer than the output file')
+    parser.add_argument('--engine', choices=['requests', 'async'], default='requests', help='Crawl engine')
     args = parser.parse_args()
 
     crawler = CrawlerFactory.create(
         bojautologin=args.cookie,
-        use_cache=not args.no_cache
+        use_cache=not args.no_cache,
+        pool_size=args.pool_size,
+        max_retries=args.retries,
+        backoff_factor=args.backoff,
+        workers=args.workers,
+        rate=args.rate,
+        engine=args.engine,
+        cache_type=args.cache_type,
+        cache_max_bytes=args.cache_max_mb * 1024 * 1024 if args.cache_max_mb else None,
+        parser_backend=args.parser
     )
 
-    crawler.crawl(args.url, args.output, args.max_pages)
+    crawler.crawl(args.url, args.output, args.max_pages, args.incremental)
     print(f"Crawling completed: {args.output}")
 
 
@@ -1,43 +1,54 @@
 import argparse
 import os
+from urllib.parse import urlsplit, parse_qsl
 from services import GraphBuilder, SubmissionRepository
 
 
 def main():
     parser = argparse.ArgumentParser(description='BOJ Graph Generator')
-    parser.add_argument('input', nargs='?', default='status.jsonl', help='Input JSONL file')
+    parser.add_argument('input', nargs='?', default='status.jsonl', help='Input JSONL, Parquet/Arrow file or SQLite store (.db)')
+    parser.add_argument('--contest', help='Contest status URL or contest id to read from a SQLite store')
     parser.add_argument('--start', default='2024-09-28 19:00:00', help='Start time')
     parser.add_argument('--end', default='2024-09-28 22:00:00', help='End time')
     parser.add_argument('--freeze', default='2024-09-28 21:30:00', help='Freeze time')
     parser.add_argument('--minute', type=int, default=3, help='Minute delta')
     parser.add_argument('--problems', default='A,B,C,D,E,F,G,H,I,J,K,L,M,N,O', help='Problem list')
     parser.add_argument('-o', '--output-dir', default='images', help='Output directory')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Parallel render processes')
+    parser.add_argument('--backend', choices=['matplotlib', 'svg', 'raster'], default='matplotlib',
+                        help='Render backend (svg and raster skip matplotlib)')
+    parser.add_argument('--force', action='store_true', help='Re-render graphs even if their data is unchanged')
+    parser.add_argument('--timelapse', metavar='PROBLEM', help='Write time-lapse frames for one problem')
     args = parser.parse_args()
 
     os.makedirs(args.output_dir, exist_ok=True)
 
-    all_submissions = SubmissionRepository.load_from_jsonl(args.input)
-    grouped = SubmissionRepository.group_by_problem(all_submissions)
-
     problems = [p.strip() for p in args.problems.split(',') if p.strip()]
+    contest_id = dict(parse_qsl(urlsplit(args.contest).query)).get('contest_id', args.contest) if args.contest else None
+    table = SubmissionRepository.load_table(args.input, SubmissionRepository.GRAPH_COLUMNS, problems,
+                                            contest_id=contest_id)
 
-    for problem_no in problems:
-        if problem_no not in grouped:
-            continue
-
-        print(f"Generating graph for problem {problem_no}...")
-
-        submissions = grouped[problem_no]
-        safe_name = problem_no.replace('/', '_')
-        output_path = os.path.join(args.output_dir, f'status_{safe_name}.png')
-
-        GraphBuilder() \
-            .with_submissions(submissions) \
+    if len(table) > 0:
+        builder = GraphBuilder() \
+            .with_submissions(table) \
             .with_time_range(args.start, args.end) \
             .with_freeze_time(args.freeze) \
             .with_minute_delta(args.minute) \
-            .with_output_path(output_path) \
-            .build()
+            .with_output_dir(args.output_dir) \
+            .with_jobs(args.jobs) \
+            .with_force(args.force) \
+            .with_backend(args.backend)
+
+        if args.timelapse:
+            frames_dir = os.path.join(args.output_dir, f"timelapse_{args.timelapse.replace('/', '_')}")
+            frames = builder.build_timelapse(args.timelapse, frames_dir)
+            print(f"Generated {len(frames)} frames for problem {args.timelapse}: {frames_dir}")
+        else:
+            builder.build_all(
+                problems,
+                lambda problem_no: print(f"Generated graph for problem {problem_no}"),
+                lambda problem_no: print(f"Skipped unchanged graph for problem {problem_no}")
+            )
 
     print("Graph generation completed")
 
@@ -0,0 +1,26 @@
+import argparse
+from domain import format_timestamp
+from services.jsonl import JsonlIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or inspect the sidecar index of a JSONL file')
+    parser.add_argument('input', nargs='?', default='status.jsonl', help='Input JSONL file')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild even if the index is up to date')
+    args = parser.parse_args()
+
+    index = None if args.rebuild else JsonlIndex.load(args.input)
+    if index is None:
+        index = JsonlIndex.build(args.input)
+        index.save()
+        print(f"Index built: {JsonlIndex.index_path(args.input)}")
+
+    print(f"Rows: {index.rows}, problems: {len(index.problems)}, max submission id: {index.max_submission_id}")
+    if index.min_ts is not None:
+        print(f"Time range: {format_timestamp(index.min_ts)} ~ {format_timestamp(index.max_ts)}")
+    for problem_no in sorted(index.problems):
+        print(f"  {problem_no}: {len(index.problems[problem_no])}")
+
+
+if __name__ == '__main__':
+    main()
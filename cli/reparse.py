@@ -0,0 +1,26 @@
+import argparse
+from urllib.parse import urlsplit, parse_qsl
+from services.reparser import CacheReparser
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild JSONL from cached BOJ status pages')
+    parser.add_argument('contest', help='Contest status URL or contest id')
+    parser.add_argument('-o', '--output', default='status.jsonl', help='Output JSONL file path')
+    parser.add_argument('--cache-type', choices=['file', 'compressed', 'sqlite'], default='file', help='Page cache backend')
+    parser.add_argument('--cache', help='Cache directory or SQLite file (default: cache / cache.db)')
+    parser.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4', help='HTML parser backend')
+    parser.add_argument('-j', '--jobs', type=int, help='Worker processes (default: all cores)')
+    args = parser.parse_args()
+
+    contest_id = dict(parse_qsl(urlsplit(args.contest).query)).get('contest_id', args.contest)
+    cache_location = args.cache or ('cache.db' if args.cache_type == 'sqlite' else 'cache')
+
+    reparser = CacheReparser(args.cache_type, cache_location, args.parser, args.jobs)
+    reparser.set_progress_callback(print)
+    count = reparser.reparse(contest_id, args.output)
+    print(f"Reparse completed: {args.output} ({count} records)")
+
+
+if __name__ == '__main__':
+    main()
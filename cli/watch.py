@@ -0,0 +1,45 @@
+import argparse
+from services import CrawlerFactory, GraphBuilder, LiveDashboard
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Live contest dashboard: poll the status page and refresh changed graphs')
+    parser.add_argument('url', help='Contest status URL')
+    parser.add_argument('-c', '--cookie', help='BOJ_AUTO_LOGIN cookie value')
+    parser.add_argument('--history', default='status.jsonl', help='Previously crawled JSONL, Parquet/Arrow file or SQLite store')
+    parser.add_argument('--start', default='2024-09-28 19:00:00', help='Start time')
+    parser.add_argument('--end', default='2024-09-28 22:00:00', help='End time')
+    parser.add_argument('--freeze', default='2024-09-28 21:30:00', help='Freeze time')
+    parser.add_argument('--minute', type=int, default=3, help='Minute delta')
+    parser.add_argument('--problems', default='A,B,C,D,E,F,G,H,I,J,K,L,M,N,O', help='Problem list')
+    parser.add_argument('-o', '--output-dir', default='images', help='Output directory')
+    parser.add_argument('--backend', choices=['matplotlib', 'svg', 'raster'], default='matplotlib',
+                        help='Render backend (svg and raster skip matplotlib)')
+    parser.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4', help='HTML parser backend')
+    parser.add_argument('--interval', type=float, default=10.0, help='Seconds between polls')
+    parser.add_argument('--polls', type=int, help='Stop after this many polls (default: run until interrupted)')
+    args = parser.parse_args()
+
+    crawler = CrawlerFactory.create(bojautologin=args.cookie, use_cache=False, parser_backend=args.parser)
+    builder = GraphBuilder() \
+        .with_time_range(args.start, args.end) \
+        .with_freeze_time(args.freeze) \
+        .with_minute_delta(args.minute) \
+        .with_output_dir(args.output_dir) \
+        .with_backend(args.backend)
+
+    problems = [p.strip() for p in args.problems.split(',') if p.strip()]
+    dashboard = LiveDashboard(crawler, builder, args.url, problems, args.interval)
+    dashboard.set_progress_callback(print)
+
+    try:
+        dashboard.seed(args.history)
+        dashboard.run(args.polls)
+    except KeyboardInterrupt:
+        dashboard.close()
+
+    print("Watch stopped")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,11 @@
-from .models import Submission, SubmissionResult, ResultCategory, BinData
+from .models import (
+    Submission, SubmissionTable, SubmissionResult, ResultCategory, BinData,
+    CATEGORY_ORDER, CATEGORY_CODES,
+    parse_timestamp, format_timestamp, timestamp_to_datetime, datetime_to_timestamp
+)
 
-__all__ = ['Submission', 'SubmissionResult', 'ResultCategory', 'BinData']
+__all__ = [
+    'Submission', 'SubmissionTable', 'SubmissionResult', 'ResultCategory', 'BinData',
+    'CATEGORY_ORDER', 'CATEGORY_CODES',
+    'parse_timestamp', 'format_timestamp', 'timestamp_to_datetime', 'datetime_to_timestamp'
+]
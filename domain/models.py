@@ -1,5 +1,10 @@
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+import sys
+import time
+import calendar
+from array import array
+from datetime import datetime, timedelta
+from dataclasses import dataclass, FrozenInstanceError
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from enum import Enum
 
 
@@ -22,18 +27,134 @@ class ResultCategory(str, Enum):
     BLUE = 'blue'
 
 
-@dataclass
+CATEGORY_ORDER = tuple(ResultCategory)
+CATEGORY_CODES = {category: index for index, category in enumerate(CATEGORY_ORDER)}
+
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+EPOCH = datetime(1970, 1, 1)
+_DAYS_CACHE: Dict[str, int] = {}
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _parse_days(date_text: str) -> Optional[int]:
+    days = _DAYS_CACHE.get(date_text)
+    if days is None:
+        year, month, day = int(date_text[0:4]), int(date_text[5:7]), int(date_text[8:10])
+        if not (1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]):
+            return None
+        days = _days_from_civil(year, month, day)
+        if len(_DAYS_CACHE) < 4096:
+            _DAYS_CACHE[date_text] = days
+    return days
+
+
+def parse_timestamp(text: Optional[str]) -> Optional[int]:
+    if not text:
+        return None
+    if len(text) != 19 or text[4] != '-' or text[7] != '-' or text[10] != ' ' or text[13] != ':' or text[16] != ':':
+        try:
+            return calendar.timegm(time.strptime(text, TIMESTAMP_FORMAT))
+        except (TypeError, ValueError):
+            return None
+
+    try:
+        days = _parse_days(text[:10])
+        hour, minute, second = int(text[11:13]), int(text[14:16]), int(text[17:19])
+    except ValueError:
+        return None
+    if days is None or hour > 23 or minute > 59 or second > 61:
+        return None
+    return days * 86400 + hour * 3600 + minute * 60 + second
+
+
+def format_timestamp(epoch: int) -> str:
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(epoch))
+
+
+def timestamp_to_datetime(epoch: int) -> datetime:
+    return EPOCH + timedelta(seconds=epoch)
+
+
+def datetime_to_timestamp(dt: datetime) -> int:
+    return (dt.replace(microsecond=0) - EPOCH) // timedelta(seconds=1)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Submission:
-    submission_id: int
-    user_id: str
-    problem_no: str
-    result: str
-    memory_kb: Optional[int]
-    time_ms: Optional[int]
-    language: str
-    source_url: Optional[str]
-    code_length: int
-    submitted_at: str
+    FIELDS = (
+        'submission_id', 'user_id', 'problem_no', 'result', 'memory_kb',
+        'time_ms', 'language', 'source_url', 'code_length', 'submitted_at'
+    )
+    __slots__ = (
+        'submission_id', 'user_id', 'problem_no', 'result', 'memory_kb',
+        'time_ms', 'language', 'source_url', 'code_length', 'submitted_ts', '_raw_submitted_at'
+    )
+
+    def __init__(self, submission_id: int, user_id: str, problem_no: str, result: str,
+                 memory_kb: Optional[int], time_ms: Optional[int], language: str,
+                 source_url: Optional[str], code_length: int, submitted_at: Optional[str] = None,
+                 submitted_ts: Optional[int] = None):
+        if submitted_ts is None:
+            submitted_ts = parse_timestamp(submitted_at)
+
+        init = object.__setattr__
+        init(self, 'submission_id', submission_id)
+        init(self, 'user_id', _intern(user_id))
+        init(self, 'problem_no', _intern(problem_no))
+        init(self, 'result', _intern(result))
+        init(self, 'memory_kb', memory_kb)
+        init(self, 'time_ms', time_ms)
+        init(self, 'language', _intern(language))
+        init(self, 'source_url', source_url)
+        init(self, 'code_length', code_length)
+        init(self, 'submitted_ts', submitted_ts)
+        init(self, '_raw_submitted_at', None if submitted_ts is not None else (submitted_at or ''))
+
+    @property
+    def submitted_at(self) -> str:
+        if self.submitted_ts is None:
+            return self._raw_submitted_at
+        return format_timestamp(self.submitted_ts)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def _key(self) -> Tuple:
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.FIELDS)
+        return f'{self.__class__.__name__}({fields})'
+
+    def __reduce__(self):
+        return self.__class__, (
+            self.submission_id, self.user_id, self.problem_no, self.result,
+            self.memory_kb, self.time_ms, self.language, self.source_url,
+            self.code_length, self._raw_submitted_at, self.submitted_ts
+        )
 
     @classmethod
     def from_raw(cls, submission_id: str, user_id: str, problem_no: str,
@@ -74,17 +195,152 @@ class Submission:
         }
 
     def classify_result(self) -> ResultCategory:
-        if self.result == SubmissionResult.ACCEPTED:
+        return self.classify(self.result)
+
+    @staticmethod
+    def classify(result: str) -> ResultCategory:
+        if result == SubmissionResult.ACCEPTED:
             return ResultCategory.GREEN
-        if self.result == SubmissionResult.WRONG_ANSWER:
+        if result == SubmissionResult.WRONG_ANSWER:
             return ResultCategory.RED
-        if self.result in (SubmissionResult.MEMORY_LIMIT_EXCEEDED,
+        if result in (SubmissionResult.MEMORY_LIMIT_EXCEEDED,
                           SubmissionResult.OUTPUT_LIMIT_EXCEEDED,
                           SubmissionResult.PRESENTATION_ERROR,
                           SubmissionResult.TIME_LIMIT_EXCEEDED):
             return ResultCategory.ORANGE
         return ResultCategory.DARK_GREY
 
+    @staticmethod
+    def is_pending(result: Optional[str]) -> bool:
+        return bool(result) and not any(result.startswith(final.value) for final in SubmissionResult)
+
+
+class SubmissionTable:
+    NULL = -(2 ** 63)
+    SOURCE_URL_PREFIX = 'https://www.acmicpc.net/source/'
+    CATEGORICAL = ('user_id', 'problem_no', 'result', 'language')
+    NUMERIC = ('submission_id', 'memory_kb', 'time_ms', 'code_length', 'submitted_ts')
+
+    def __init__(self):
+        self.numeric: Dict[str, array] = {name: array('q') for name in self.NUMERIC}
+        self.codes: Dict[str, array] = {name: array('i') for name in self.CATEGORICAL}
+        self.dictionaries: Dict[str, List[str]] = {name: [] for name in self.CATEGORICAL}
+        self._lookup: Dict[str, Dict[str, int]] = {name: {} for name in self.CATEGORICAL}
+        self.has_source = array('b')
+        self.custom_source_urls: Dict[int, str] = {}
+        self.raw_submitted_at: Dict[int, str] = {}
+
+    @classmethod
+    def from_submissions(cls, submissions: Iterable[Submission]) -> 'SubmissionTable':
+        table = cls()
+        table.extend(submissions)
+        return table
+
+    @classmethod
+    def from_columns(cls, length: int, numeric: Dict[str, array],
+                     categorical: Dict[str, Tuple[array, List[str]]],
+                     source_urls: Optional[List[Optional[str]]] = None) -> 'SubmissionTable':
+        table = cls()
+        for name in cls.NUMERIC:
+            table.numeric[name] = numeric[name] if name in numeric else array('q', [cls.NULL]) * length
+        for name in cls.CATEGORICAL:
+            codes, dictionary = categorical.get(name, (array('i', [0]) * length, ['']))
+            table.codes[name] = codes
+            table.dictionaries[name] = [sys.intern(value) for value in dictionary]
+            table._lookup[name] = {value: code for code, value in enumerate(dictionary)}
+
+        table.has_source = array('b', [0]) * length
+        if source_urls is not None:
+            ids = table.numeric['submission_id']
+            for index, source_url in enumerate(source_urls):
+                if not source_url:
+                    continue
+                table.has_source[index] = 1
+                if source_url != f'{cls.SOURCE_URL_PREFIX}{ids[index]}':
+                    table.custom_source_urls[index] = source_url
+        return table
+
+    def __len__(self) -> int:
+        return len(self.numeric['submission_id'])
+
+    def __iter__(self) -> Iterator[Submission]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> Submission:
+        if index < 0:
+            index += len(self)
+        values = {name: self._numeric_value(name, index) for name in self.NUMERIC}
+        for name in self.CATEGORICAL:
+            values[name] = self.dictionaries[name][self.codes[name][index]]
+        return Submission(
+            submission_id=values['submission_id'],
+            user_id=values['user_id'],
+            problem_no=values['problem_no'],
+            result=values['result'],
+            memory_kb=values['memory_kb'],
+            time_ms=values['time_ms'],
+            language=values['language'],
+            source_url=self._source_url(index, values['submission_id']),
+            code_length=values['code_length'],
+            submitted_at=self.raw_submitted_at.get(index),
+            submitted_ts=values['submitted_ts']
+        )
+
+    def append(self, submission: Submission):
+        index = len(self)
+        for name in self.NUMERIC:
+            value = getattr(submission, name)
+            self.numeric[name].append(self.NULL if value is None else value)
+        for name in self.CATEGORICAL:
+            self.codes[name].append(self._encode(name, getattr(submission, name)))
+        source_url = submission.source_url
+        self.has_source.append(1 if source_url else 0)
+        if source_url and source_url != f'{self.SOURCE_URL_PREFIX}{submission.submission_id}':
+            self.custom_source_urls[index] = source_url
+        if submission.submitted_ts is None:
+            self.raw_submitted_at[index] = submission.submitted_at
+
+    def extend(self, submissions: Iterable[Submission]):
+        for submission in submissions:
+            self.append(submission)
+
+    def column(self, name: str) -> List[Any]:
+        if name in self.numeric:
+            return [None if value == self.NULL else value for value in self.numeric[name]]
+        if name in self.codes:
+            dictionary = self.dictionaries[name]
+            return [dictionary[code] for code in self.codes[name]]
+        if name == 'source_url':
+            ids = self.numeric['submission_id']
+            return [self._source_url(index, ids[index]) for index in range(len(self))]
+        raise KeyError(name)
+
+    def _source_url(self, index: int, submission_id: Optional[int]) -> Optional[str]:
+        if not self.has_source[index]:
+            return None
+        return self.custom_source_urls.get(index) or f'{self.SOURCE_URL_PREFIX}{submission_id}'
+
+    def timestamps(self) -> List[int]:
+        return [value for value in self.numeric['submitted_ts'] if value != self.NULL]
+
+    def code_of(self, name: str, value: str) -> Optional[int]:
+        return self._lookup[name].get(value)
+
+    def _numeric_value(self, name: str, index: int) -> Optional[int]:
+        value = self.numeric[name][index]
+        return None if value == self.NULL else value
+
+    def _encode(self, name: str, value: Optional[str]) -> int:
+        value = value or ''
+        lookup = self._lookup[name]
+        code = lookup.get(value)
+        if code is None:
+            code = len(self.dictionaries[name])
+            lookup[value] = code
+            self.dictionaries[name].append(sys.intern(value))
+        return code
+
 
 @dataclass
 class BinData:
@@ -94,6 +350,10 @@ class BinData:
     dark_grey: int = 0
     blue: int = 0
 
+    @classmethod
+    def from_counts(cls, counts) -> 'BinData':
+        return cls(**{category.value: int(counts[index]) for index, category in enumerate(CATEGORY_ORDER)})
+
     def increment(self, category: ResultCategory):
         setattr(self, category.value, getattr(self, category.value) + 1)
 
@@ -1,3 +1,21 @@
-from .main_window import MainWindow, run_gui
+import importlib
 
-__all__ = ['MainWindow', 'run_gui']
+_EXPORTS = {
+    'MainWindow': 'main_window',
+    'run_gui': 'main_window',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
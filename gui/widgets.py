@@ -1,5 +1,5 @@
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional, List
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
@@ -9,7 +9,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QPixmap
 
-from services import CrawlerFactory, GraphBuilder, SubmissionRepository, ConverterFactory
+from domain import timestamp_to_datetime
+import services
 
 
 class WorkerThread(QThread):
@@ -69,11 +70,15 @@ class CrawlerWidget(QWidget):
         self.use_cache_checkbox = QCheckBox("캐시 사용")
         self.use_cache_checkbox.setChecked(True)
 
+        self.incremental_checkbox = QCheckBox("증분 크롤링 (새 제출만 수집)")
+        self.incremental_checkbox.setChecked(False)
+
         layout.addRow("BOJ 쿠키:", self.bojautologin_input)
         layout.addRow("대회 URL:", self.url_input)
         layout.addRow("출력 파일:", self.output_input)
         layout.addRow("최대 페이지:", self.max_pages_input)
         layout.addRow("", self.use_cache_checkbox)
+        layout.addRow("", self.incremental_checkbox)
 
         return group
 
@@ -83,6 +88,7 @@ class CrawlerWidget(QWidget):
         bojautologin = self.bojautologin_input.text().strip() or None
         max_pages = self.max_pages_input.value() if self.max_pages_input.value() > 0 else None
         use_cache = self.use_cache_checkbox.isChecked()
+        incremental = self.incremental_checkbox.isChecked()
 
         if not url:
             QMessageBox.warning(self, "경고", "URL을 입력해주세요.")
@@ -95,9 +101,9 @@ class CrawlerWidget(QWidget):
         self.progress_text.append("크롤링을 시작합니다...")
 
         def task(progress_callback):
-            crawler = CrawlerFactory.create(bojautologin, use_cache)
+            crawler = services.CrawlerFactory.create(bojautologin, use_cache)
             crawler.set_progress_callback(progress_callback)
-            crawler.crawl(url, output_file, max_pages)
+            crawler.crawl(url, output_file, max_pages, incremental)
 
         self.worker = WorkerThread(task)
         self.worker.progress.connect(self.progress_text.append)
@@ -148,8 +154,12 @@ class GraphWidget(QWidget):
         browse_button = QPushButton("찾아보기")
         browse_button.clicked.connect(self._browse_file)
 
+        self.contest_input = QLineEdit()
+        self.contest_input.setPlaceholderText("대회 번호 (SQLite 입력 시)")
+
         layout.addWidget(self.input_file)
         layout.addWidget(browse_button)
+        layout.addWidget(self.contest_input)
 
         return group
 
@@ -166,6 +176,11 @@ class GraphWidget(QWidget):
         self.minute_delta_input.setMaximum(60)
         self.minute_delta_input.setValue(3)
 
+        self.jobs_input = QSpinBox()
+        self.jobs_input.setMinimum(1)
+        self.jobs_input.setMaximum(os.cpu_count() or 1)
+        self.jobs_input.setValue(1)
+
         auto_detect_button = QPushButton("데이터에서 시간 자동 감지")
         auto_detect_button.clicked.connect(self._auto_detect_time_range)
 
@@ -173,6 +188,7 @@ class GraphWidget(QWidget):
         layout.addRow("종료 시간:", self.end_time_input)
         layout.addRow("프리즈 시간:", self.freeze_time_input)
         layout.addRow("집계 간격(분):", self.minute_delta_input)
+        layout.addRow("렌더링 프로세스:", self.jobs_input)
         layout.addRow("", auto_detect_button)
 
         return group
@@ -189,7 +205,7 @@ class GraphWidget(QWidget):
 
     def _browse_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "JSONL 파일 선택", "", "JSONL files (*.jsonl);;All files (*.*)"
+            self, "JSONL 파일 선택", "", "JSONL files (*.jsonl);;Parquet/Arrow files (*.parquet *.arrow *.feather);;SQLite files (*.db);;All files (*.*)"
         )
         if file_path:
             self.input_file.setText(file_path)
@@ -202,25 +218,13 @@ class GraphWidget(QWidget):
             return
 
         try:
-            submissions = SubmissionRepository.load_from_jsonl(input_file)
-            if not submissions:
-                QMessageBox.warning(self, "경고", "JSONL 파일에 데이터가 없습니다.")
-                return
-
-            all_times = []
-            for submission in submissions:
-                try:
-                    dt = datetime.strptime(submission.submitted_at, '%Y-%m-%d %H:%M:%S')
-                    all_times.append(dt)
-                except:
-                    continue
-
-            if not all_times:
+            bounds = services.SubmissionRepository.time_bounds(input_file, self.contest_input.text().strip() or None)
+            if bounds is None:
                 QMessageBox.warning(self, "경고", "유효한 시간 데이터가 없습니다.")
                 return
 
-            min_time = min(all_times)
-            max_time = max(all_times)
+            min_time = timestamp_to_datetime(bounds[0])
+            max_time = timestamp_to_datetime(bounds[1])
 
             start_time = min_time.replace(minute=0, second=0, microsecond=0)
             if min_time.minute >= 30:
@@ -257,7 +261,9 @@ class GraphWidget(QWidget):
         end_time = self.end_time_input.text().strip()
         freeze_time = self.freeze_time_input.text().strip()
         minute_delta = self.minute_delta_input.value()
+        jobs = self.jobs_input.value()
         problems_text = self.problems_input.text().strip()
+        contest_id = self.contest_input.text().strip() or None
 
         if not input_file or not os.path.exists(input_file):
             QMessageBox.warning(self, "경고", "입력 파일이 존재하지 않습니다.")
@@ -275,30 +281,26 @@ class GraphWidget(QWidget):
             os.makedirs('images', exist_ok=True)
             progress_callback("JSONL 파일을 읽는 중...")
 
-            all_submissions = SubmissionRepository.load_from_jsonl(input_file)
-            grouped = SubmissionRepository.group_by_problem(all_submissions)
-
-            generated = 0
-            for problem_no in problems:
-                if problem_no not in grouped:
-                    continue
-
-                progress_callback(f"문제 {problem_no} 그래프 생성 중...")
-                submissions = grouped[problem_no]
-
-                safe_name = problem_no.replace('/', '_')
-                output_path = os.path.join('images', f'status_{safe_name}.png')
-
-                GraphBuilder() \
-                    .with_submissions(submissions) \
-                    .with_time_range(start_time, end_time) \
-                    .with_freeze_time(freeze_time) \
-                    .with_minute_delta(minute_delta) \
-                    .with_output_path(output_path) \
-                    .build()
+            table = services.SubmissionRepository.load_table(
+                input_file, services.SubmissionRepository.GRAPH_COLUMNS, problems, contest_id=contest_id
+            )
+            if len(table) == 0:
+                raise ValueError("생성된 그래프가 없습니다.")
 
-                generated += 1
+            output_paths = services.GraphBuilder() \
+                .with_submissions(table) \
+                .with_time_range(start_time, end_time) \
+                .with_freeze_time(freeze_time) \
+                .with_minute_delta(minute_delta) \
+                .with_output_dir('images') \
+                .with_jobs(jobs) \
+                .build_all(
+                    problems,
+                    lambda problem_no: progress_callback(f"문제 {problem_no} 그래프 생성 완료"),
+                    lambda problem_no: progress_callback(f"문제 {problem_no} 변경 없음, 건너뜀")
+                )
 
+            generated = len(output_paths)
             if generated == 0:
                 raise ValueError("생성된 그래프가 없습니다.")
 
@@ -346,12 +348,23 @@ class ConverterWidget(QWidget):
         self.convert_input = QLineEdit("status.jsonl")
         self.convert_output = QLineEdit("status.csv")
 
+        self.convert_format = QComboBox()
+        self.convert_format.addItems(["csv", "parquet", "arrow"])
+        self.convert_format.currentTextChanged.connect(self._on_format_changed)
+
         self.convert_delimiter = QComboBox()
         self.convert_delimiter.addItems([",", ";", "\t"])
 
+        self.convert_jobs = QSpinBox()
+        self.convert_jobs.setMinimum(1)
+        self.convert_jobs.setMaximum(os.cpu_count() or 1)
+        self.convert_jobs.setValue(1)
+
         layout.addRow("입력 JSONL:", self.convert_input)
-        layout.addRow("출력 CSV:", self.convert_output)
+        layout.addRow("출력 파일:", self.convert_output)
+        layout.addRow("출력 형식:", self.convert_format)
         layout.addRow("구분자:", self.convert_delimiter)
+        layout.addRow("변환 프로세스:", self.convert_jobs)
 
         return group
 
@@ -367,11 +380,19 @@ class ConverterWidget(QWidget):
 
         return group
 
+    def _on_format_changed(self, file_format: str):
+        base, _ = os.path.splitext(self.convert_output.text().strip() or 'status')
+        self.convert_output.setText(f"{base}.{file_format}")
+        self.convert_delimiter.setEnabled(file_format == 'csv')
+        self.convert_jobs.setEnabled(file_format == 'csv')
+
     def _convert_to_csv(self):
         input_file = self.convert_input.text().strip()
         output_file = self.convert_output.text().strip()
         delimiter = self.convert_delimiter.currentText()
         fields_text = self.fields_input.text().strip()
+        jobs = self.convert_jobs.value()
+        file_format = self.convert_format.currentText()
 
         if not input_file or not os.path.exists(input_file):
             QMessageBox.warning(self, "경고", "입력 파일이 존재하지 않습니다.")
@@ -383,14 +404,17 @@ class ConverterWidget(QWidget):
         fields = [f.strip() for f in fields_text.split(',') if f.strip()] if fields_text else None
 
         try:
-            converter = ConverterFactory.create_jsonl_to_csv(input_file, output_file, fields, delimiter)
+            if file_format == 'csv':
+                converter = services.ConverterFactory.create_jsonl_to_csv(input_file, output_file, fields, delimiter, jobs)
+            else:
+                converter = services.ConverterFactory.create_jsonl_to_columnar(input_file, output_file, fields, file_format)
             converter.convert()
 
-            message = f"CSV 변환 완료: {output_file}"
+            message = f"{file_format.upper()} 변환 완료: {output_file}"
             self.result_text.setText(message)
             QMessageBox.information(self, "완료", message)
         except Exception as e:
-            error_msg = f"CSV 변환 중 오류가 발생했습니다: {str(e)}"
+            error_msg = f"{file_format.upper()} 변환 중 오류가 발생했습니다: {str(e)}"
             self.result_text.setText(error_msg)
             QMessageBox.critical(self, "오류", error_msg)
 
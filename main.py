@@ -1,4 +1,7 @@
-from gui import run_gui
+import multiprocessing
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
+
+    from gui import run_gui
     run_gui()
@@ -1,9 +1,26 @@
-from .crawler import BojCrawler, CrawlerFactory
-from .graph_builder import GraphBuilder, SubmissionRepository
-from .converter import FileConverter, ConverterFactory
-
-__all__ = [
-    'BojCrawler', 'CrawlerFactory',
-    'GraphBuilder', 'SubmissionRepository',
-    'FileConverter', 'ConverterFactory'
-]
+import importlib
+
+_EXPORTS = {
+    'BojCrawler': 'crawler',
+    'CrawlerFactory': 'crawler',
+    'GraphBuilder': 'graph_builder',
+    'SubmissionRepository': 'graph_builder',
+    'LiveDashboard': 'live',
+    'FileConverter': 'converter',
+    'ConverterFactory': 'converter',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
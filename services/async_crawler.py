@@ -0,0 +1,187 @@
+import time
+import asyncio
+import aiohttp
+from typing import List, Tuple, Optional, Callable
+
+from domain import Submission
+from .crawler import CacheStrategy, HttpClient, StatusPageParser
+from .jsonl import JsonlIndex, JsonlWriter
+
+
+class AsyncHttpClient:
+    RETRY_STATUSES = HttpClient.RETRY_STATUSES
+
+    def __init__(self, bojautologin: str, cache_strategy: CacheStrategy,
+                 pool_size: int = 10, max_retries: int = 3, backoff_factor: float = 0.5):
+        self.bojautologin = bojautologin
+        self.cache_strategy = cache_strategy
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def open(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    'User-Agent': HttpClient.USER_AGENT,
+                    'Cookie': f'bojautologin={self.bojautologin};',
+                }
+            )
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def fetch(self, url: str) -> Tuple[str, bool]:
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, self.cache_strategy.get, url)
+        if cached:
+            return cached, True
+
+        if not self.bojautologin:
+            raise ValueError("BOJ_AUTO_LOGIN cookie is required")
+
+        await self.open()
+        html = await self._get_with_retry(url)
+
+        await loop.run_in_executor(None, self.cache_strategy.set, url, html)
+        return html, False
+
+    async def _get_with_retry(self, url: str) -> str:
+        attempt = 0
+        while True:
+            async with self.session.get(url) as response:
+                if response.status in self.RETRY_STATUSES and attempt < self.max_retries:
+                    delay = self._retry_delay(response, attempt)
+                else:
+                    response.raise_for_status()
+                    return await response.text()
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff_factor * (2 ** attempt)
+
+
+class AsyncBojCrawler:
+    QUEUE_SIZE = 16
+
+    def __init__(self, http_client: AsyncHttpClient, parser: StatusPageParser,
+                 request_interval: float = 0.5):
+        self.http_client = http_client
+        self.parser = parser
+        self.request_interval = request_interval
+        self.progress_callback: Optional[Callable[[str], None]] = None
+
+    def set_progress_callback(self, callback: Callable[[str], None]):
+        self.progress_callback = callback
+
+    def _log(self, message: str):
+        if self.progress_callback:
+            self.progress_callback(message)
+
+    def crawl(self, start_url: str, output_path: str, max_pages: Optional[int] = None,
+              incremental: bool = False):
+        if incremental:
+            raise ValueError("async 엔진은 증분 크롤링을 지원하지 않습니다.")
+        asyncio.run(self.crawl_async(start_url, output_path, max_pages))
+
+        index = JsonlIndex.build(output_path)
+        index.save()
+        self._log(f"[인덱스] 레코드: {index.rows}개, 문제: {len(index.problems)}개, {JsonlIndex.index_path(output_path)}")
+
+    async def crawl_async(self, start_url: str, output_path: str, max_pages: Optional[int] = None):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        out = JsonlWriter(output_path, atomic=True)
+        out.open()
+        writer = asyncio.create_task(self._write(queue, out))
+
+        try:
+            await self._produce(queue, writer, start_url, max_pages)
+            await self._put(queue, writer, None)
+            await writer
+        except BaseException:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+            out.abort()
+            raise
+        else:
+            out.close()
+        finally:
+            await self.http_client.close()
+
+    @staticmethod
+    async def _put(queue: asyncio.Queue, writer: asyncio.Task, item: Optional[List[Submission]]):
+        put = asyncio.ensure_future(queue.put(item))
+        done, _ = await asyncio.wait({put, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if put not in done:
+            put.cancel()
+            writer.result()
+            raise RuntimeError("JSONL writer stopped before the crawl finished")
+
+    async def _produce(self, queue: asyncio.Queue, writer: asyncio.Task, start_url: str,
+                       max_pages: Optional[int]):
+        loop = asyncio.get_running_loop()
+        visited = set()
+        current_url = start_url
+        page_count = 0
+        next_fetch_at = 0.0
+
+        while current_url:
+            if current_url in visited:
+                break
+            visited.add(current_url)
+
+            wait = next_fetch_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            self._log(f"[페이지 {page_count + 1}] 크롤링 중: {current_url}")
+            cache_strategy = self.http_client.cache_strategy
+            parsed = await loop.run_in_executor(None, cache_strategy.get_parsed, current_url)
+            if parsed is not None:
+                submissions, next_url = parsed
+                self._log("[가져오기] 소스: parsed")
+            else:
+                html, from_cache = await self.http_client.fetch(current_url)
+                if not from_cache:
+                    next_fetch_at = time.monotonic() + self.request_interval
+                source = 'cache' if from_cache else 'web'
+                self._log(f"[가져오기] 소스: {source}")
+
+                submissions, next_url = await loop.run_in_executor(None, self.parser.parse, html)
+                await loop.run_in_executor(None, cache_strategy.set_parsed, current_url, submissions, next_url)
+            await self._put(queue, writer, submissions)
+
+            page_count += 1
+            if max_pages is not None and page_count >= max_pages:
+                self._log("[완료] 최대 페이지 수에 도달했습니다.")
+                break
+
+            current_url = next_url
+            if not current_url:
+                self._log("[완료] 모든 페이지 크롤링이 완료되었습니다.")
+
+    async def _write(self, queue: asyncio.Queue, out: JsonlWriter):
+        loop = asyncio.get_running_loop()
+        total_records = 0
+        started_at = time.time()
+
+        while True:
+            submissions: Optional[List[Submission]] = await queue.get()
+            if submissions is None:
+                break
+
+            await loop.run_in_executor(None, out.write_batch, submissions)
+            total_records += len(submissions)
+
+            elapsed = time.time() - started_at
+            self._log(f"[파싱 완료] 레코드: {len(submissions)}개, 총: {total_records}개, 경과시간: {elapsed:.2f}초")
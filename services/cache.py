@@ -0,0 +1,404 @@
+import os
+import gzip
+import time
+import sqlite3
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit, parse_qsl
+
+from domain import Submission
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class CacheStrategy(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str):
+        pass
+
+    def keys(self) -> List[str]:
+        return []
+
+    def get_parsed(self, key: str) -> Optional[Tuple[List[Submission], Optional[str]]]:
+        return None
+
+    def set_parsed(self, key: str, submissions: List[Submission], next_url: Optional[str]):
+        pass
+
+
+class FileCacheStrategy(CacheStrategy):
+    def __init__(self, cache_dir: str = 'cache'):
+        self.cache_dir = cache_dir
+        self._ensure_cache_dir()
+
+    def _ensure_cache_dir(self):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _get_cache_path(self, url: str) -> str:
+        encoded = quote(url, safe='')
+        return os.path.join(self.cache_dir, f'{encoded}.html')
+
+    def get(self, key: str) -> Optional[str]:
+        cache_path = self._get_cache_path(key)
+        if os.path.isfile(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        return None
+
+    def set(self, key: str, value: str):
+        cache_path = self._get_cache_path(key)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(value)
+
+    def keys(self) -> List[str]:
+        return [unquote(name[:-len('.html')]) for name in os.listdir(self.cache_dir) if name.endswith('.html')]
+
+
+class NoCacheStrategy(CacheStrategy):
+    def get(self, key: str) -> Optional[str]:
+        return None
+
+    def set(self, key: str, value: str):
+        pass
+
+
+class CompressedCacheStrategy(CacheStrategy):
+    HEAD_KIND = 'head'
+    PAGE_KIND = 'page'
+
+    def __init__(self, cache_dir: str = 'cache', head_ttl: Optional[float] = 60,
+                 page_ttl: Optional[float] = None, max_bytes: Optional[int] = 512 * 1024 * 1024,
+                 compression: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self.head_ttl = head_ttl
+        self.page_ttl = page_ttl
+        self.max_bytes = max_bytes
+        self.compression = compression or ('zstd' if zstandard else 'gzip')
+        if self.compression == 'zstd' and zstandard is None:
+            raise ValueError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+        self._total_bytes: Optional[int] = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[str]:
+        kind = self._kind(key)
+        for path in self._candidate_paths(key, kind):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            if self._is_expired(kind, stat.st_mtime):
+                self._remove(path, stat.st_size)
+                return None
+
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path, (time.time(), stat.st_mtime))
+            return self._decompress(path, data)
+        return None
+
+    def set(self, key: str, value: str):
+        kind = self._kind(key)
+        path = self._path(key, kind, self.compression)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        for stale in self._candidate_paths(key, kind):
+            if stale != path and os.path.isfile(stale):
+                self._remove(stale, os.path.getsize(stale))
+
+        previous = os.path.getsize(path) if os.path.isfile(path) else 0
+        data = self._compress(value.encode('utf-8'))
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._write_url(path, key)
+
+        if self._total_bytes is not None:
+            self._total_bytes += len(data) - previous
+        if self.max_bytes is not None and self.total_bytes() > self.max_bytes:
+            self.prune()
+
+    def keys(self) -> List[str]:
+        urls = []
+        for path, _, _, _, _ in self._scan():
+            try:
+                with open(self._url_path(path), 'r', encoding='utf-8') as f:
+                    urls.append(f.read())
+            except FileNotFoundError:
+                continue
+        return urls
+
+    def total_bytes(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _, _, _ in self._scan())
+        return self._total_bytes
+
+    def stats(self) -> Dict[str, int]:
+        entries = self._scan()
+        now = time.time()
+        return {
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _, _, _ in entries),
+            'head_entries': sum(1 for _, _, _, _, kind in entries if kind == self.HEAD_KIND),
+            'expired': sum(1 for _, _, _, mtime, kind in entries if self._is_expired(kind, mtime, now)),
+        }
+
+    def prune(self, max_bytes: Optional[int] = None) -> Tuple[int, int]:
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        now = time.time()
+        removed = 0
+        freed = 0
+        alive = []
+
+        for path, size, atime, mtime, kind in self._scan():
+            if self._is_expired(kind, mtime, now):
+                self._remove(path, size)
+                removed += 1
+                freed += size
+            else:
+                alive.append((atime, path, size))
+
+        total = sum(size for _, _, size in alive)
+        if budget is not None and total > budget:
+            target = int(budget * 0.9)
+            for _, path, size in sorted(alive):
+                if total <= target:
+                    break
+                self._remove(path, size)
+                total -= size
+                removed += 1
+                freed += size
+
+        self._total_bytes = total
+        return removed, freed
+
+    def _kind(self, url: str) -> str:
+        query = dict(parse_qsl(urlsplit(url).query))
+        return self.PAGE_KIND if 'top' in query else self.HEAD_KIND
+
+    def _ttl(self, kind: str) -> Optional[float]:
+        return self.head_ttl if kind == self.HEAD_KIND else self.page_ttl
+
+    def _is_expired(self, kind: str, mtime: float, now: Optional[float] = None) -> bool:
+        ttl = self._ttl(kind)
+        if ttl is None:
+            return False
+        return (now if now is not None else time.time()) - mtime > ttl
+
+    def _path(self, url: str, kind: str, compression: str) -> str:
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        ext = '.zst' if compression == 'zstd' else '.gz'
+        return os.path.join(self.cache_dir, digest[:2], digest[2:4], f'{digest}.{kind}.html{ext}')
+
+    def _candidate_paths(self, url: str, kind: str) -> List[str]:
+        return [self._path(url, kind, 'zstd'), self._path(url, kind, 'gzip')]
+
+    @staticmethod
+    def _url_path(path: str) -> str:
+        return f"{path.rsplit('.html', 1)[0]}.url"
+
+    def _write_url(self, path: str, url: str):
+        url_path = self._url_path(path)
+        if os.path.isfile(url_path):
+            return
+        tmp_path = f'{url_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(url)
+        os.replace(tmp_path, url_path)
+
+    def _scan(self) -> List[Tuple[str, int, float, float, str]]:
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not (name.endswith('.html.gz') or name.endswith('.html.zst')):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                kind = name.split('.')[1]
+                entries.append((path, stat.st_size, stat.st_atime, stat.st_mtime, kind))
+        return entries
+
+    def _remove(self, path: str, size: int):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        try:
+            os.remove(self._url_path(path))
+        except FileNotFoundError:
+            pass
+        if self._total_bytes is not None:
+            self._total_bytes -= size
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    @staticmethod
+    def _decompress(path: str, data: bytes) -> str:
+        if path.endswith('.zst'):
+            if zstandard is None:
+                raise ValueError("zstd 캐시를 읽으려면 zstandard 패키지가 필요합니다.")
+            return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+        return gzip.decompress(data).decode('utf-8')
+
+
+class SqliteCacheStrategy(CacheStrategy):
+    SUBMISSION_FIELDS = (
+        'submission_id', 'user_id', 'problem_no', 'result', 'memory_kb',
+        'time_ms', 'language', 'source_url', 'code_length', 'submitted_at'
+    )
+
+    def __init__(self, db_path: str = 'cache.db'):
+        self.db_path = db_path
+        parent = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(parent, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.create_function('contest_id', 1, self.contest_id_of, deterministic=True)
+        self._init_schema()
+
+    @staticmethod
+    def contest_id_of(url: Optional[str]) -> Optional[str]:
+        if not url:
+            return None
+        return dict(parse_qsl(urlsplit(url).query)).get('contest_id')
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS pages ('
+                'url TEXT PRIMARY KEY, html TEXT, next_url TEXT, '
+                'parsed INTEGER NOT NULL DEFAULT 0, fetched_at REAL)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS submissions ('
+                'submission_id INTEGER PRIMARY KEY, user_id TEXT, problem_no TEXT, result TEXT, '
+                'memory_kb INTEGER, time_ms INTEGER, language TEXT, source_url TEXT, '
+                'code_length INTEGER, submitted_at TEXT, contest_id TEXT)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS page_rows ('
+                'url TEXT NOT NULL, position INTEGER NOT NULL, submission_id INTEGER NOT NULL, '
+                'PRIMARY KEY (url, position))'
+            )
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(submissions)')}
+            if 'contest_id' not in columns:
+                self._conn.execute('ALTER TABLE submissions ADD COLUMN contest_id TEXT')
+                self._conn.execute(
+                    'UPDATE submissions SET contest_id = ('
+                    'SELECT contest_id(r.url) FROM page_rows r WHERE r.submission_id = submissions.submission_id '
+                    'LIMIT 1)'
+                )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_submissions_problem ON submissions (problem_no)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_submissions_contest ON submissions (contest_id)')
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute('SELECT html FROM pages WHERE url = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO pages (url, html, fetched_at) VALUES (?, ?, ?) '
+                'ON CONFLICT(url) DO UPDATE SET html = excluded.html, parsed = 0, '
+                'next_url = NULL, fetched_at = excluded.fetched_at',
+                (key, value, time.time())
+            )
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute('SELECT url FROM pages WHERE html IS NOT NULL').fetchall()
+        return [row[0] for row in rows]
+
+    def get_parsed(self, key: str) -> Optional[Tuple[List[Submission], Optional[str]]]:
+        with self._lock:
+            page = self._conn.execute('SELECT next_url, parsed FROM pages WHERE url = ?', (key,)).fetchone()
+            if not page or not page[1]:
+                return None
+            rows = self._conn.execute(
+                f'SELECT {", ".join("s." + f for f in self.SUBMISSION_FIELDS)} '
+                'FROM page_rows r JOIN submissions s ON s.submission_id = r.submission_id '
+                'WHERE r.url = ? ORDER BY r.position',
+                (key,)
+            ).fetchall()
+        return [self._to_submission(row) for row in rows], page[0]
+
+    def set_parsed(self, key: str, submissions: List[Submission], next_url: Optional[str]):
+        fields = self.SUBMISSION_FIELDS + ('contest_id',)
+        placeholders = ', '.join('?' for _ in fields)
+        contest_id = self.contest_id_of(key)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f'INSERT OR REPLACE INTO submissions ({", ".join(fields)}) VALUES ({placeholders})',
+                [self._to_row(s) + (contest_id,) for s in submissions if s.submission_id is not None]
+            )
+            self._conn.execute('DELETE FROM page_rows WHERE url = ?', (key,))
+            self._conn.executemany(
+                'INSERT INTO page_rows (url, position, submission_id) VALUES (?, ?, ?)',
+                [(key, i, s.submission_id) for i, s in enumerate(submissions) if s.submission_id is not None]
+            )
+            self._conn.execute(
+                'INSERT INTO pages (url, next_url, parsed, fetched_at) VALUES (?, ?, 1, ?) '
+                'ON CONFLICT(url) DO UPDATE SET next_url = excluded.next_url, parsed = 1',
+                (key, next_url, time.time())
+            )
+
+    def contest_ids(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT DISTINCT contest_id FROM submissions WHERE contest_id IS NOT NULL'
+            ).fetchall()
+        return sorted(row[0] for row in rows)
+
+    def load_submissions(self, problems: Optional[List[str]] = None,
+                         contest_id: Optional[str] = None) -> List[Submission]:
+        if contest_id is None:
+            contests = self.contest_ids()
+            if len(contests) > 1:
+                raise ValueError(f"여러 대회의 제출 기록이 저장되어 있습니다 ({', '.join(contests)}). 대회 번호를 지정하세요.")
+
+        query = f'SELECT {", ".join(self.SUBMISSION_FIELDS)} FROM submissions'
+        conditions = []
+        params: Tuple = ()
+        if contest_id is not None:
+            conditions.append('contest_id = ?')
+            params += (str(contest_id),)
+        if problems:
+            conditions.append(f'problem_no IN ({", ".join("?" for _ in problems)})')
+            params += tuple(problems)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY submission_id DESC'
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._to_submission(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _to_row(self, submission: Submission) -> Tuple:
+        return tuple(getattr(submission, field) for field in self.SUBMISSION_FIELDS)
+
+    def _to_submission(self, row: Tuple) -> Submission:
+        return Submission(**dict(zip(self.SUBMISSION_FIELDS, row)))
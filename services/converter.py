@@ -1,23 +1,13 @@
+import io
 import os
-import json
 import csv
-from typing import List, Optional, Generator, Any
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Generator, Iterable, Iterator, Any, Tuple, Union
 
-
-class JsonlReader:
-    def __init__(self, file_path: str):
-        self.file_path = file_path
-
-    def read(self) -> Generator[dict, None, None]:
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    yield json.loads(line)
-                except Exception:
-                    continue
+from domain import parse_timestamp
+from .jsonl import JsonlReader
 
 
 class CsvWriter:
@@ -43,6 +33,15 @@ class CsvWriter:
                 row = [self._to_str(record.get(field)) for field in self.fields]
                 writer.writerow(row)
 
+    def format_rows(self, records: Iterable[dict], header: bool = False) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=self.delimiter)
+        if header:
+            writer.writerow(self.fields)
+        for record in records:
+            writer.writerow([self._to_str(record.get(field)) for field in self.fields])
+        return buffer.getvalue()
+
     def _ensure_parent_dir(self):
         parent = os.path.dirname(os.path.abspath(self.file_path))
         if parent and not os.path.isdir(parent):
@@ -53,8 +52,101 @@ class CsvWriter:
         return '' if value is None else str(value)
 
 
+class ArrowWriter:
+    FORMATS = ('parquet', 'arrow')
+    INTEGER_FIELDS = ('submission_id', 'memory_kb', 'time_ms', 'code_length')
+    DICTIONARY_FIELDS = ('user_id', 'problem_no', 'result', 'language')
+    TIMESTAMP_FIELDS = ('submitted_at',)
+    DEFAULT_BATCH_ROWS = 64 * 1024
+
+    def __init__(self, file_path: str, fields: Optional[List[str]] = None, file_format: str = 'parquet',
+                 compression: str = 'zstd', batch_rows: int = DEFAULT_BATCH_ROWS):
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Unknown columnar format: {file_format}")
+        try:
+            import pyarrow
+        except ImportError:
+            raise ValueError(f"{file_format} output requested but pyarrow is not installed")
+
+        self.pa = pyarrow
+        self.file_path = file_path
+        self.fields = fields or CsvWriter.DEFAULT_FIELDS
+        self.file_format = file_format
+        self.compression = compression
+        self.batch_rows = batch_rows
+        self.schema = pyarrow.schema([(field, self._field_type(field)) for field in self.fields])
+        self._dictionaries: Dict[str, Tuple[Dict[str, int], List[str]]] = {
+            field: ({}, []) for field in self.fields if field in self.DICTIONARY_FIELDS
+        }
+
+    def _field_type(self, field: str):
+        pa = self.pa
+        if field in self.INTEGER_FIELDS:
+            return pa.int64()
+        if field in self.DICTIONARY_FIELDS:
+            return pa.dictionary(pa.int32(), pa.string())
+        if field in self.TIMESTAMP_FIELDS:
+            return pa.timestamp('s')
+        return pa.string()
+
+    def write(self, data: Iterable[dict]):
+        parent = os.path.dirname(os.path.abspath(self.file_path))
+        os.makedirs(parent, exist_ok=True)
+
+        with self._open_writer() as writer:
+            batch = []
+            for record in data:
+                batch.append(record)
+                if len(batch) >= self.batch_rows:
+                    writer.write_batch(self._record_batch(batch))
+                    batch = []
+            if batch:
+                writer.write_batch(self._record_batch(batch))
+
+    def _open_writer(self):
+        pa = self.pa
+        if self.file_format == 'parquet':
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(self.file_path, self.schema, compression=self.compression)
+        options = pa.ipc.IpcWriteOptions(compression=self.compression, emit_dictionary_deltas=True)
+        return pa.ipc.new_file(self.file_path, self.schema, options=options)
+
+    def _record_batch(self, records: List[dict]):
+        pa = self.pa
+        columns = []
+        for field in self.fields:
+            values = [record.get(field) for record in records]
+            if field in self._dictionaries:
+                lookup, dictionary = self._dictionaries[field]
+                indices = [self._dictionary_code(lookup, dictionary, value) for value in values]
+                columns.append(pa.DictionaryArray.from_arrays(
+                    pa.array(indices, type=pa.int32()), pa.array(dictionary, type=pa.string())
+                ))
+            elif field in self.TIMESTAMP_FIELDS:
+                columns.append(pa.array(
+                    [parse_timestamp(value) if value else None for value in values], type=pa.timestamp('s')
+                ))
+            elif field in self.INTEGER_FIELDS:
+                columns.append(pa.array(values, type=pa.int64()))
+            else:
+                columns.append(pa.array([None if value is None else str(value) for value in values], type=pa.string()))
+        return pa.record_batch(columns, schema=self.schema)
+
+    @staticmethod
+    def _dictionary_code(lookup: Dict[str, int], dictionary: List[str], value: Any) -> Optional[int]:
+        if value is None:
+            return None
+        value = str(value)
+        code = lookup.get(value)
+        if code is None:
+            code = len(dictionary)
+            lookup[value] = code
+            dictionary.append(value)
+        return code
+
+
 class FileConverter:
-    def __init__(self, reader: JsonlReader, writer: CsvWriter):
+    def __init__(self, reader: JsonlReader, writer: Union[CsvWriter, ArrowWriter]):
         self.reader = reader
         self.writer = writer
 
@@ -63,11 +155,69 @@ class FileConverter:
         self.writer.write(data)
 
 
+class ParallelFileConverter:
+    DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, input_path: str, writer: CsvWriter, jobs: int,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.input_path = input_path
+        self.writer = writer
+        self.jobs = max(1, jobs)
+        self.chunk_size = chunk_size
+
+    def convert(self):
+        self.writer._ensure_parent_dir()
+        context = multiprocessing.get_context('spawn')
+        tasks = (
+            (self.input_path, start, end, self.writer.fields, self.writer.delimiter)
+            for start, end in self.chunks()
+        )
+
+        with open(self.writer.file_path, 'wb') as out, \
+                ProcessPoolExecutor(max_workers=self.jobs, mp_context=context) as executor:
+            out.write(self.writer.format_rows((), header=True).encode('utf-8-sig'))
+
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(_convert_chunk, task))
+                if len(pending) >= self.jobs * 2:
+                    out.write(pending.popleft().result())
+            while pending:
+                out.write(pending.popleft().result())
+
+    def chunks(self) -> Iterator[Tuple[int, int]]:
+        size = os.path.getsize(self.input_path)
+        with open(self.input_path, 'rb') as f:
+            start = 0
+            while start < size:
+                f.seek(min(start + self.chunk_size, size))
+                f.readline()
+                end = min(f.tell(), size)
+                yield start, end
+                start = end
+
+
+def _convert_chunk(task: Tuple[str, int, int, List[str], str]) -> bytes:
+    path, start, end, fields, delimiter = task
+    records = JsonlReader(path).read(start, end)
+    return CsvWriter(path, fields, delimiter).format_rows(records).encode('utf-8')
+
+
 class ConverterFactory:
     @staticmethod
     def create_jsonl_to_csv(input_path: str, output_path: str,
                            fields: Optional[List[str]] = None,
-                           delimiter: str = ',') -> FileConverter:
-        reader = JsonlReader(input_path)
+                           delimiter: str = ',', jobs: int = 1) -> Union[FileConverter, ParallelFileConverter]:
         writer = CsvWriter(output_path, fields, delimiter)
+        if jobs > 1:
+            return ParallelFileConverter(input_path, writer, jobs)
+        reader = JsonlReader(input_path)
+        return FileConverter(reader, writer)
+
+    @staticmethod
+    def create_jsonl_to_columnar(input_path: str, output_path: str,
+                                 fields: Optional[List[str]] = None,
+                                 file_format: str = 'parquet') -> FileConverter:
+        reader = JsonlReader(input_path)
+        writer = ArrowWriter(output_path, fields, file_format)
         return FileConverter(reader, writer)
@@ -1,88 +1,100 @@
 import os
 import json
 import time
+import shutil
+import threading
 import requests
-import dotenv
-from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Callable
-from urllib.parse import urljoin, quote
-from bs4 import BeautifulSoup
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from domain import Submission
-
-
-class CacheStrategy(ABC):
-    @abstractmethod
-    def get(self, key: str) -> Optional[str]:
-        pass
-
-    @abstractmethod
-    def set(self, key: str, value: str):
-        pass
-
-
-class FileCacheStrategy(CacheStrategy):
-    def __init__(self, cache_dir: str = 'cache'):
-        self.cache_dir = cache_dir
-        self._ensure_cache_dir()
-
-    def _ensure_cache_dir(self):
-        if not os.path.isdir(self.cache_dir):
-            os.makedirs(self.cache_dir, exist_ok=True)
-
-    def _get_cache_path(self, url: str) -> str:
-        encoded = quote(url, safe='')
-        return os.path.join(self.cache_dir, f'{encoded}.html')
-
-    def get(self, key: str) -> Optional[str]:
-        cache_path = self._get_cache_path(key)
-        if os.path.isfile(cache_path):
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        return None
-
-    def set(self, key: str, value: str):
-        cache_path = self._get_cache_path(key)
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            f.write(value)
-
-
-class NoCacheStrategy(CacheStrategy):
-    def get(self, key: str) -> Optional[str]:
-        return None
-
-    def set(self, key: str, value: str):
-        pass
+from .jsonl import JsonlIndex, JsonlReader, JsonlWriter, json_loads
+from .cache import (
+    CacheStrategy, FileCacheStrategy, NoCacheStrategy,
+    CompressedCacheStrategy, SqliteCacheStrategy
+)
 
 
 class HttpClient:
-    def __init__(self, bojautologin: str, cache_strategy: CacheStrategy):
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, bojautologin: str, cache_strategy: CacheStrategy,
+                 pool_size: int = 10, max_retries: int = 3, backoff_factor: float = 0.5):
         self.bojautologin = bojautologin
         self.cache_strategy = cache_strategy
-
-    def fetch(self, url: str) -> Tuple[str, bool]:
-        cached = self.cache_strategy.get(url)
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.adapter = self._create_adapter()
+        self.session = self._create_session()
+
+    def _create_adapter(self) -> HTTPAdapter:
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        return HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry
+        )
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        session.headers.update({
+            'User-Agent': self.USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive',
+        })
+        return session
+
+    def fetch(self, url: str, use_cache: bool = True) -> Tuple[str, bool]:
+        cached = self.cache_strategy.get(url) if use_cache else None
         if cached:
             return cached, True
 
         if not self.bojautologin:
             raise ValueError("BOJ_AUTO_LOGIN cookie is required")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Cookie': f'bojautologin={self.bojautologin};'
-        }
-        response = requests.get(url, headers=headers)
+        headers = {'Cookie': f'bojautologin={self.bojautologin};'}
+        response = self.session.get(url, headers=headers)
         response.raise_for_status()
         html = response.text
 
         self.cache_strategy.set(url, html)
         return html, False
 
+    def connection_stats(self) -> Tuple[int, int]:
+        pools = self.adapter.poolmanager.pools
+        requests_made = 0
+        connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests_made += pool.num_requests
+                connections += pool.num_connections
+        return requests_made, connections
+
+    def close(self):
+        self.session.close()
+
 
 class StatusPageParser:
     @staticmethod
     def parse(html: str) -> Tuple[List[Submission], Optional[str]]:
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(html, 'html.parser')
         rows = soup.select('table#status-table tbody tr')
         submissions = []
@@ -160,6 +172,88 @@ class StatusPageParser:
         return None
 
 
+class LxmlStatusPageParser(StatusPageParser):
+    ROWS_XPATH = '//table[@id="status-table"]//tbody//tr'
+    NEXT_XPATH = '//a[@id="next_page"]'
+
+    @staticmethod
+    def parse(html: str) -> Tuple[List[Submission], Optional[str]]:
+        if not html or not html.strip():
+            return [], None
+
+        from lxml import html as lxml_html
+
+        doc = lxml_html.fromstring(html)
+        submissions = []
+
+        for tr in doc.xpath(LxmlStatusPageParser.ROWS_XPATH):
+            tds = tr.xpath('.//td')
+            if len(tds) < 9:
+                continue
+
+            submission = LxmlStatusPageParser._parse_row(tds)
+            if submission:
+                submissions.append(submission)
+
+        next_url = LxmlStatusPageParser._extract_next_url(doc)
+        return submissions, next_url
+
+    @staticmethod
+    def _text(element) -> str:
+        return ''.join(part.strip() for part in element.itertext())
+
+    @staticmethod
+    def _first_text(cell, tag: str) -> str:
+        child = cell.find(f'.//{tag}')
+        return LxmlStatusPageParser._text(child if child is not None else cell)
+
+    @staticmethod
+    def _parse_row(tds) -> Optional[Submission]:
+        try:
+            text = LxmlStatusPageParser._text
+            first_text = LxmlStatusPageParser._first_text
+
+            lang_cell = tds[6]
+            time_anchor = tds[8].find('.//a')
+            if time_anchor is not None and 'title' in time_anchor.attrib:
+                submitted_at = time_anchor.get('title')
+            else:
+                submitted_at = text(tds[8])
+
+            return Submission.from_raw(
+                submission_id=text(tds[0]),
+                user_id=first_text(tds[1], 'a'),
+                problem_no=first_text(tds[2], 'a'),
+                result=first_text(tds[3], 'span'),
+                memory_text=text(tds[4]),
+                time_text=text(tds[5]),
+                language=first_text(lang_cell, 'a'),
+                source_url=LxmlStatusPageParser._extract_source_url(lang_cell),
+                code_len_text=text(tds[7]),
+                submitted_at=submitted_at
+            )
+        except Exception:
+            return None
+
+    @staticmethod
+    def _extract_source_url(lang_cell) -> Optional[str]:
+        lang_anchor = lang_cell.find('.//a')
+        if lang_anchor is not None and lang_anchor.get('href', '').startswith('/source/'):
+            return urljoin('https://www.acmicpc.net', lang_anchor.get('href'))
+
+        src_a = lang_cell.find('.//a[@href]')
+        if src_a is not None and '/source/' in src_a.get('href'):
+            return urljoin('https://www.acmicpc.net', src_a.get('href'))
+        return None
+
+    @staticmethod
+    def _extract_next_url(doc) -> Optional[str]:
+        next_a = doc.xpath(LxmlStatusPageParser.NEXT_XPATH)
+        if next_a and next_a[0].get('href') is not None:
+            return urljoin('https://www.acmicpc.net', next_a[0].get('href'))
+        return None
+
+
 class BojCrawler:
     def __init__(self, http_client: HttpClient, parser: StatusPageParser):
         self.http_client = http_client
@@ -173,14 +267,38 @@ class BojCrawler:
         if self.progress_callback:
             self.progress_callback(message)
 
-    def crawl(self, start_url: str, output_path: str, max_pages: Optional[int] = None):
+    def _log_connection_stats(self):
+        requests_made, connections = self.http_client.connection_stats()
+        reused = max(0, requests_made - connections)
+        self._log(f"[연결] 요청: {requests_made}회, 새 연결: {connections}개, 재사용: {reused}회")
+
+    def crawl(self, start_url: str, output_path: str, max_pages: Optional[int] = None,
+              incremental: bool = False):
+        checkpoint = CrawlCheckpoint(output_path)
+        state = checkpoint.load(start_url, incremental)
+
+        if state:
+            self._log(f"[재개] 체크포인트에서 이어서 크롤링합니다: {state['next_url']}")
+        else:
+            known_max, pending_from = self._read_known_ids(output_path) if incremental else (None, None)
+            state = checkpoint.start(start_url, incremental, known_max, pending_from)
+            if known_max is not None:
+                self._log(f"[증분] 마지막 제출 번호: {known_max}")
+            if pending_from is not None:
+                self._log(f"[증분] 채점 중인 가장 오래된 제출 번호: {pending_from}")
+
+        known_max = state['known_max']
+        pending_from = state.get('pending_from')
+        keep_from = pending_from if pending_from is not None else known_max + 1 if known_max is not None else None
         visited = set()
-        current_url = start_url
-        total_records = 0
+        current_url = state['next_url']
+        total_records = state['total_records']
+        page_count = state['page_count']
+        page_limit = None if max_pages is None else max_pages + (page_count if incremental else 0)
+        stopped_early = False
         started_at = time.time()
 
-        with open(output_path, 'w', encoding='utf-8') as out:
-            page_count = 0
+        with JsonlWriter(checkpoint.partial_path, append=True) as out:
             while current_url:
                 if current_url in visited:
                     break
@@ -188,49 +306,381 @@ class BojCrawler:
 
                 self._log(f"[페이지 {page_count + 1}] 크롤링 중: {current_url}")
 
-                html, from_cache = self.http_client.fetch(current_url)
-                source = 'cache' if from_cache else 'web'
+                submissions, next_url, source = self._fetch_and_parse(current_url, use_cache=not incremental)
                 self._log(f"[가져오기] 소스: {source}")
 
-                submissions, next_url = self.parser.parse(html)
+                reached_known = False
+                if known_max is not None:
+                    reached_known = any(s.submission_id is not None and s.submission_id <= keep_from
+                                        for s in submissions)
+                    submissions = [s for s in submissions
+                                   if s.submission_id is not None and s.submission_id >= keep_from]
 
-                for submission in submissions:
-                    out.write(json.dumps(submission.to_dict(), ensure_ascii=False) + '\n')
+                out.write_batch(submissions)
                 total_records += len(submissions)
 
                 elapsed = time.time() - started_at
                 self._log(f"[파싱 완료] 레코드: {len(submissions)}개, 총: {total_records}개, 경과시간: {elapsed:.2f}초")
 
                 page_count += 1
-                if max_pages is not None and page_count >= max_pages:
+                current_url = None if reached_known else next_url
+                checkpoint.save(current_url, page_count, total_records, out.checkpoint())
+
+                if reached_known:
+                    self._log("[완료] 이미 수집된 제출 번호에 도달했습니다.")
+                    break
+                if page_limit is not None and page_count >= page_limit:
                     self._log("[완료] 최대 페이지 수에 도달했습니다.")
+                    stopped_early = known_max is not None and current_url is not None
                     break
 
-                current_url = next_url
                 if current_url:
                     time.sleep(0.5)
                 else:
                     self._log("[완료] 모든 페이지 크롤링이 완료되었습니다.")
 
+        if stopped_early:
+            self._log("[보류] 이미 수집된 제출 번호에 도달하지 못해 병합하지 않습니다. "
+                      "다음 증분 실행에서 체크포인트부터 이어서 수집합니다.")
+            return
+
+        checkpoint.commit(output_path, incremental)
+        self._write_index(output_path)
+
+    def _write_index(self, output_path: str):
+        index = JsonlIndex.build(output_path)
+        index.save()
+        self._log(f"[인덱스] 레코드: {index.rows}개, 문제: {len(index.problems)}개, {JsonlIndex.index_path(output_path)}")
+
+    def _fetch_and_parse(self, url: str, use_cache: bool = True) -> Tuple[List[Submission], Optional[str], str]:
+        cache_strategy = self.http_client.cache_strategy
+        if use_cache:
+            parsed = cache_strategy.get_parsed(url)
+            if parsed is not None:
+                submissions, next_url = parsed
+                return submissions, next_url, 'parsed'
+
+        html, from_cache = self.http_client.fetch(url, use_cache=use_cache)
+        if not from_cache:
+            self._log_connection_stats()
+
+        submissions, next_url = self.parser.parse(html)
+        cache_strategy.set_parsed(url, submissions, next_url)
+        return submissions, next_url, 'cache' if from_cache else 'web'
+
+    @staticmethod
+    def _read_known_ids(output_path: str) -> Tuple[Optional[int], Optional[int]]:
+        if not os.path.isfile(output_path):
+            return None, None
+
+        index = JsonlIndex.open(output_path)
+        return index.max_submission_id, index.min_pending_id
+
+
+class CrawlCheckpoint:
+    def __init__(self, output_path: str):
+        self.path = f'{output_path}.checkpoint'
+        self.partial_path = f'{output_path}.partial'
+        self.state: dict = {}
+
+    def load(self, start_url: str, incremental: bool) -> Optional[dict]:
+        if not os.path.isfile(self.path) or not os.path.isfile(self.partial_path):
+            return None
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception:
+            return None
+
+        if state.get('start_url') != start_url or state.get('incremental') != incremental:
+            return None
+        if not state.get('next_url'):
+            return None
+
+        with open(self.partial_path, 'r+b') as f:
+            f.truncate(state['partial_size'])
+
+        self.state = state
+        return state
+
+    def start(self, start_url: str, incremental: bool, known_max: Optional[int],
+              pending_from: Optional[int] = None) -> dict:
+        open(self.partial_path, 'w', encoding='utf-8').close()
+        self.state = {
+            'start_url': start_url,
+            'incremental': incremental,
+            'known_max': known_max,
+            'pending_from': pending_from,
+            'next_url': start_url,
+            'page_count': 0,
+            'total_records': 0,
+            'partial_size': 0,
+        }
+        self._write()
+        return self.state
+
+    def save(self, next_url: Optional[str], page_count: int, total_records: int, partial_size: int):
+        self.state.update({
+            'next_url': next_url,
+            'page_count': page_count,
+            'total_records': total_records,
+            'partial_size': partial_size,
+        })
+        self._write()
+
+    def commit(self, output_path: str, incremental: bool):
+        tmp_path = f'{output_path}.tmp'
+        with open(tmp_path, 'wb') as out:
+            with open(self.partial_path, 'rb') as partial:
+                shutil.copyfileobj(partial, out)
+            if incremental and os.path.isfile(output_path):
+                with open(output_path, 'rb') as existing:
+                    self._copy_existing(existing, out)
+        os.replace(tmp_path, output_path)
+
+        for path in (self.partial_path, self.path):
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def _copy_existing(self, existing, out):
+        pending_from = self.state.get('pending_from')
+        if pending_from is None:
+            shutil.copyfileobj(existing, out)
+            return
+
+        refreshed = set()
+        for record in JsonlReader(self.partial_path).read():
+            submission_id = record.get('submission_id')
+            if isinstance(submission_id, int):
+                refreshed.add(submission_id)
+
+        for line in existing:
+            try:
+                submission_id = json_loads(line).get('submission_id')
+            except Exception:
+                out.write(line)
+                continue
+            if isinstance(submission_id, int) and submission_id < pending_from:
+                out.write(line)
+                break
+            if submission_id not in refreshed:
+                out.write(line)
+        shutil.copyfileobj(existing, out)
+
+    def _write(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+class RateLimiter:
+    def __init__(self, rate: Optional[float] = None):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        if self.interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ConcurrentBojCrawler(BojCrawler):
+    WINDOWS_PER_WORKER = 4
+
+    def __init__(self, http_client: HttpClient, parser: StatusPageParser,
+                 workers: int = 4, rate: Optional[float] = None):
+        super().__init__(http_client, parser)
+        self.workers = max(1, workers)
+        self.rate_limiter = RateLimiter(rate)
+        self._stats_lock = threading.Lock()
+        self._page_count = 0
+
+    def crawl(self, start_url: str, output_path: str, max_pages: Optional[int] = None,
+              incremental: bool = False):
+        if max_pages is not None or incremental:
+            self._log("[안내] 최대 페이지 수 또는 증분 모드가 지정되어 순차 모드로 크롤링합니다.")
+            super().crawl(start_url, output_path, max_pages, incremental)
+            return
+
+        started_at = time.time()
+        self._page_count = 0
+
+        head, _ = self._fetch_page(start_url)
+        if not head:
+            with JsonlWriter(output_path, atomic=True):
+                pass
+            self._log("[완료] 제출 기록이 없습니다.")
+            self._write_index(output_path)
+            return
+
+        max_id = max(s.submission_id for s in head)
+        min_id = self._find_min_submission_id(start_url, head)
+        windows = self._split_windows(min_id, max_id)
+        self._log(f"[분할] 제출 번호 {min_id}~{max_id}, 구간: {len(windows)}개, 작업자: {self.workers}개")
+
+        total_records = 0
+        seen = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor, \
+                JsonlWriter(output_path, atomic=True) as out:
+            futures = [executor.submit(self._crawl_window, start_url, lo, hi) for lo, hi in windows]
+
+            for future in futures:
+                batch = []
+                for submission in future.result():
+                    if submission.submission_id in seen:
+                        continue
+                    seen.add(submission.submission_id)
+                    batch.append(submission)
+                out.write_batch(batch)
+                total_records += len(batch)
+
+                elapsed = time.time() - started_at
+                self._log(f"[구간 완료] 총: {total_records}개, 페이지: {self._page_count}개, 경과시간: {elapsed:.2f}초")
+
+        self._log("[완료] 모든 페이지 크롤링이 완료되었습니다.")
+        self._write_index(output_path)
+
+    def _fetch_page(self, url: str) -> Tuple[List[Submission], Optional[str]]:
+        self.rate_limiter.acquire()
+        submissions, next_url, source = self._fetch_and_parse(url)
+
+        with self._stats_lock:
+            self._page_count += 1
+            page_no = self._page_count
+        self._log(f"[페이지 {page_no}] 소스: {source}, {url}")
+
+        submissions = [s for s in submissions if s.submission_id is not None]
+        return submissions, next_url
+
+    def _find_min_submission_id(self, start_url: str, head: List[Submission]) -> int:
+        lo = 1
+        hi = min(s.submission_id for s in head)
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            page, next_url = self._fetch_page(self._with_top(start_url, mid))
+            if not page:
+                lo = mid + 1
+                continue
+
+            hi = min(s.submission_id for s in page)
+            if not next_url:
+                break
+
+        return hi
+
+    def _split_windows(self, min_id: int, max_id: int) -> List[Tuple[int, int]]:
+        count = self.workers * self.WINDOWS_PER_WORKER
+        span = max(1, -(-(max_id - min_id + 1) // count))
+
+        windows = []
+        hi = max_id
+        while hi >= min_id:
+            lo = max(min_id, hi - span + 1)
+            windows.append((lo, hi))
+            hi = lo - 1
+        return windows
+
+    def _crawl_window(self, start_url: str, lo: int, hi: int) -> List[Submission]:
+        collected = []
+        visited = set()
+        top = hi + 1
+
+        while top is not None and top not in visited:
+            visited.add(top)
+            page, next_url = self._fetch_page(self._with_top(start_url, top))
+
+            collected.extend(s for s in page if lo <= s.submission_id <= hi)
+            if not page or not next_url or min(s.submission_id for s in page) <= lo:
+                break
+
+            top = self._extract_top(next_url)
+
+        return collected
+
+    @staticmethod
+    def _with_top(url: str, top: int) -> str:
+        parts = urlsplit(url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'top']
+        query.append(('top', str(top)))
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+    @staticmethod
+    def _extract_top(url: str) -> Optional[int]:
+        for key, value in parse_qsl(urlsplit(url).query):
+            if key == 'top' and value.isdigit():
+                return int(value)
+        return None
+
 
 class CrawlerFactory:
     @staticmethod
-    def create(bojautologin: Optional[str] = None, use_cache: bool = True) -> BojCrawler:
+    def create(bojautologin: Optional[str] = None, use_cache: bool = True,
+               pool_size: int = 10, max_retries: int = 3,
+               backoff_factor: float = 0.5, workers: int = 1,
+               rate: Optional[float] = None, engine: str = 'requests',
+               cache_type: str = 'file', cache_max_bytes: Optional[int] = None,
+               parser_backend: str = 'bs4'):
         if bojautologin is None:
             bojautologin = CrawlerFactory._load_from_env()
 
         if not bojautologin:
             raise ValueError("BOJ_AUTO_LOGIN 쿠키 값이 필요합니다.")
 
-        cache_strategy = FileCacheStrategy() if use_cache else NoCacheStrategy()
-        http_client = HttpClient(bojautologin, cache_strategy)
-        parser = StatusPageParser()
+        cache_strategy = CrawlerFactory._create_cache_strategy(use_cache, cache_type, cache_max_bytes)
+        parser = CrawlerFactory._create_parser(parser_backend)
+
+        if engine == 'async':
+            from .async_crawler import AsyncHttpClient, AsyncBojCrawler
+            http_client = AsyncHttpClient(bojautologin, cache_strategy, pool_size, max_retries, backoff_factor)
+            request_interval = 1.0 / rate if rate and rate > 0 else 0.5
+            return AsyncBojCrawler(http_client, parser, request_interval)
+        if engine != 'requests':
+            raise ValueError(f"Unknown crawl engine: {engine}")
 
+        http_client = HttpClient(bojautologin, cache_strategy, max(pool_size, workers), max_retries, backoff_factor)
+
+        if workers > 1:
+            return ConcurrentBojCrawler(http_client, parser, workers, rate)
         return BojCrawler(http_client, parser)
 
+    @staticmethod
+    def _create_parser(parser_backend: str) -> StatusPageParser:
+        if parser_backend == 'bs4':
+            return StatusPageParser()
+        if parser_backend == 'lxml':
+            return LxmlStatusPageParser()
+        raise ValueError(f"Unknown parser backend: {parser_backend}")
+
+    @staticmethod
+    def _create_cache_strategy(use_cache: bool, cache_type: str,
+                               cache_max_bytes: Optional[int] = None) -> CacheStrategy:
+        if not use_cache:
+            return NoCacheStrategy()
+        if cache_type == 'file':
+            return FileCacheStrategy()
+        if cache_type == 'compressed':
+            if cache_max_bytes is None:
+                return CompressedCacheStrategy()
+            return CompressedCacheStrategy(max_bytes=cache_max_bytes)
+        if cache_type == 'sqlite':
+            return SqliteCacheStrategy()
+        raise ValueError(f"Unknown cache type: {cache_type}")
+
     @staticmethod
     def _load_from_env() -> Optional[str]:
         try:
+            import dotenv
             env_values = dotenv.dotenv_values('.env')
             return env_values.get('BOJ_AUTO_LOGIN', '')
         except:
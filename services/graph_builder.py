@@ -1,11 +1,20 @@
 import os
 import json
-import matplotlib.pyplot as plt
+import hashlib
+import multiprocessing
+import numpy as np
+from array import array
 from datetime import datetime, timedelta
 from collections import defaultdict
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from domain import Submission, ResultCategory, BinData
+from domain import (
+    Submission, SubmissionTable, ResultCategory, BinData, CATEGORY_ORDER, CATEGORY_CODES,
+    parse_timestamp, timestamp_to_datetime, datetime_to_timestamp
+)
+from .cache import SqliteCacheStrategy
+from .jsonl import JsonlIndex, JsonlReader
 
 
 class TimeRange:
@@ -14,20 +23,20 @@ class TimeRange:
         self.end = end
 
     @classmethod
-    def from_submissions(cls, submissions: List[Submission], minute_delta: int = 3):
-        times = []
-        for submission in submissions:
-            try:
-                dt = datetime.strptime(submission.submitted_at, '%Y-%m-%d %H:%M:%S')
-                times.append(dt)
-            except:
-                continue
+    def from_submissions(cls, submissions: Iterable[Submission], minute_delta: int = 3):
+        times = [s.submitted_ts for s in submissions if s.submitted_ts is not None]
+        return cls.from_timestamps(times, minute_delta)
 
+    @classmethod
+    def from_timestamps(cls, timestamps: Iterable[int], minute_delta: int = 3):
+        times = list(timestamps)
         if not times:
             now = datetime.now()
             return cls(now, now)
 
-        return cls(min(times), max(times) + timedelta(minutes=minute_delta))
+        start = timestamp_to_datetime(min(times))
+        end = timestamp_to_datetime(max(times)) + timedelta(minutes=minute_delta)
+        return cls(start, end)
 
     @classmethod
     def from_strings(cls, start_str: str, end_str: str):
@@ -36,44 +45,219 @@ class TimeRange:
         return cls(start, end)
 
 
+class BinnedCounts:
+    def __init__(self, bin_starts: np.ndarray, counts: np.ndarray, groups: Optional[List[str]] = None):
+        self.bin_starts = bin_starts
+        self.counts = counts
+        self.groups = groups if groups is not None else ['']
+
+    def group_index(self, group: str) -> int:
+        return self.groups.index(group)
+
+    def to_bin_data(self, group_index: int = 0) -> Dict[datetime, BinData]:
+        return self.to_dict(*self.compact(group_index))
+
+    def compact(self, group_index: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        counts = self.counts[group_index]
+        present = np.flatnonzero(counts.sum(axis=1))
+        return self.bin_starts[present], counts[present]
+
+    @staticmethod
+    def to_dict(bin_starts: np.ndarray, counts: np.ndarray) -> Dict[datetime, BinData]:
+        return {
+            timestamp_to_datetime(int(start)): BinData.from_counts(row)
+            for start, row in zip(bin_starts, counts)
+        }
+
+
 class SubmissionBinner:
+    BLUE = CATEGORY_CODES[ResultCategory.BLUE]
+
     def __init__(self, minute_delta: int = 3, freeze_time: Optional[datetime] = None):
         self.minute_delta = minute_delta
         self.freeze_time = freeze_time
 
-    def bin_submissions(self, submissions: List[Submission]) -> Dict[datetime, BinData]:
-        binned = defaultdict(BinData)
+    def bin_keys(self, timestamps: np.ndarray) -> np.ndarray:
+        hour_start = timestamps - timestamps % 3600
+        minute = (timestamps % 3600) // 60
+        return hour_start + (minute // self.minute_delta) * (self.minute_delta * 60)
 
+    def freeze_categories(self, timestamps: np.ndarray, categories: np.ndarray) -> np.ndarray:
+        if not self.freeze_time:
+            return categories
+        freeze_ts = datetime_to_timestamp(self.freeze_time)
+        return np.where(timestamps >= freeze_ts, self.BLUE, categories)
+
+    def bin_submissions(self, submissions: Iterable[Submission]) -> Dict[datetime, BinData]:
+        timestamps = []
+        categories = []
         for submission in submissions:
-            try:
-                dt = datetime.strptime(submission.submitted_at, '%Y-%m-%d %H:%M:%S')
-            except:
+            if submission.submitted_ts is None:
                 continue
+            timestamps.append(submission.submitted_ts)
+            categories.append(CATEGORY_CODES[submission.classify_result()])
+
+        binned = self.bin_arrays(
+            np.asarray(timestamps, dtype=np.int64),
+            np.asarray(categories, dtype=np.int64)
+        )
+        return binned.to_bin_data()
+
+    def bin_table(self, table: SubmissionTable, problems: Optional[List[str]] = None) -> BinnedCounts:
+        timestamps, categories, group_codes, groups, _ = self.table_columns(table, problems)
+        return self.bin_arrays(timestamps, categories, group_codes, groups)
+
+    def table_columns(self, table: SubmissionTable, problems: Optional[List[str]] = None) -> tuple:
+        timestamps = np.frombuffer(table.numeric['submitted_ts'], dtype=np.int64)
+        problem_codes = np.frombuffer(table.codes['problem_no'], dtype=np.int32)
+        result_codes = np.frombuffer(table.codes['result'], dtype=np.int32)
+
+        result_categories = np.array(
+            [CATEGORY_CODES[Submission.classify(result)] for result in table.dictionaries['result']],
+            dtype=np.int64
+        )
+        categories = result_categories[result_codes] if len(result_codes) else np.zeros(0, dtype=np.int64)
+
+        dictionary = table.dictionaries['problem_no']
+        groups = list(problems) if problems is not None else [p for p in dictionary if p]
+        code_to_group = np.full(len(dictionary) + 1, -1, dtype=np.int64)
+        for group_index, problem_no in enumerate(groups):
+            code = table.code_of('problem_no', problem_no)
+            if code is not None:
+                code_to_group[code] = group_index
+        group_codes = code_to_group[problem_codes] if len(problem_codes) else np.zeros(0, dtype=np.int64)
+
+        valid = (timestamps != SubmissionTable.NULL) & (group_codes >= 0)
+        return timestamps[valid], categories[valid], group_codes[valid], groups, valid
+
+    def bin_arrays(self, timestamps: np.ndarray, categories: np.ndarray,
+                   group_codes: Optional[np.ndarray] = None,
+                   groups: Optional[List[str]] = None) -> BinnedCounts:
+        n_groups = len(groups) if groups is not None else 1
+        n_categories = len(CATEGORY_ORDER)
+
+        categories = self.freeze_categories(timestamps, categories)
+        keys = self.bin_keys(timestamps)
+        bin_starts, bin_index = np.unique(keys, return_inverse=True)
+        n_bins = len(bin_starts)
+
+        if group_codes is None:
+            group_codes = np.zeros(len(timestamps), dtype=np.int64)
+
+        flat = (group_codes * n_bins + bin_index.reshape(-1)) * n_categories + categories
+        counts = np.bincount(flat, minlength=n_groups * n_bins * n_categories)
+        return BinnedCounts(bin_starts, counts.reshape(n_groups, n_bins, n_categories), groups)
 
-            bin_key = dt.replace(
-                minute=(dt.minute // self.minute_delta) * self.minute_delta,
-                second=0,
-                microsecond=0
-            )
 
-            if self.freeze_time and dt >= self.freeze_time:
-                category = ResultCategory.BLUE
+class IncrementalBinner:
+    PENDING = CATEGORY_CODES[ResultCategory.DARK_GREY]
+
+    def __init__(self, binner: SubmissionBinner, binned: BinnedCounts, known_max_id: Optional[int] = None):
+        self.binner = binner
+        self.groups = list(binned.groups)
+        self.bin_starts = binned.bin_starts.astype(np.int64)
+        self.counts = binned.counts.astype(np.int64)
+        self.known_max_id = known_max_id
+        self._group_index = {problem_no: index for index, problem_no in enumerate(self.groups)}
+        self._seen: Dict[int, Tuple[int, int, int]] = {}
+
+    @classmethod
+    def from_table(cls, binner: SubmissionBinner, table: SubmissionTable, problems: List[str]) -> 'IncrementalBinner':
+        timestamps, categories, group_codes, groups, valid = binner.table_columns(table, problems)
+        incremental = cls(binner, binner.bin_arrays(timestamps, categories, group_codes, groups))
+
+        ids = np.frombuffer(table.numeric['submission_id'], dtype=np.int64)
+        known = ids[ids != SubmissionTable.NULL]
+        if len(known):
+            incremental.known_max_id = int(known.max())
+
+        pending_results = np.array([Submission.is_pending(result) for result in table.dictionaries['result']] + [False])
+        result_codes = np.frombuffer(table.codes['result'], dtype=np.int32)[valid]
+        ids = ids[valid]
+        keys = binner.bin_keys(timestamps)
+        categories = binner.freeze_categories(timestamps, categories)
+        pending = pending_results[result_codes] & (categories == cls.PENDING) & (ids != SubmissionTable.NULL)
+        for submission_id, group, key, category in zip(
+                ids[pending], group_codes[pending], keys[pending], categories[pending]):
+            incremental._seen[int(submission_id)] = (int(group), int(key), int(category))
+        return incremental
+
+    def update(self, submissions: Iterable[Submission]) -> List[str]:
+        changed = set()
+        newest = self.known_max_id
+        for submission in submissions:
+            submission_id = submission.submission_id
+            if submission_id is None or submission.submitted_ts is None:
+                continue
+            group = self._group_index.get(submission.problem_no)
+            if group is None:
+                continue
+
+            previous = self._seen.get(submission_id)
+            if previous is None and self.known_max_id is not None and submission_id <= self.known_max_id:
+                continue
+
+            timestamps = np.array([submission.submitted_ts], dtype=np.int64)
+            categories = np.array([CATEGORY_CODES[submission.classify_result()]], dtype=np.int64)
+            key = int(self.binner.bin_keys(timestamps)[0])
+            category = int(self.binner.freeze_categories(timestamps, categories)[0])
+
+            entry = (group, key, category)
+            if previous != entry:
+                if previous is not None:
+                    self._add(previous, -1)
+                    changed.add(previous[0])
+                self._add(entry, 1)
+                changed.add(group)
+
+            if category == self.PENDING and Submission.is_pending(submission.result):
+                self._seen[submission_id] = entry
             else:
-                category = submission.classify_result()
+                self._seen.pop(submission_id, None)
+            newest = submission_id if newest is None else max(newest, submission_id)
 
-            binned[bin_key].increment(category)
+        if newest is not None:
+            self.known_max_id = newest
+        return [self.groups[group] for group in sorted(changed)]
 
-        return dict(binned)
+    def oldest_pending(self) -> Optional[int]:
+        return min(self._seen) if self._seen else None
+
+    def _add(self, entry: Tuple[int, int, int], delta: int):
+        group, key, category = entry
+        index = int(np.searchsorted(self.bin_starts, key))
+        if index == len(self.bin_starts) or self.bin_starts[index] != key:
+            self.bin_starts = np.insert(self.bin_starts, index, key)
+            self.counts = np.insert(self.counts, index, 0, axis=1)
+        self.counts[group, index, category] += delta
+
+    def compact(self, problem_no: str) -> Tuple[np.ndarray, np.ndarray]:
+        counts = self.counts[self._group_index[problem_no]]
+        present = np.flatnonzero(counts.sum(axis=1))
+        return self.bin_starts[present], counts[present]
 
 
 class GraphRenderer:
-    def __init__(self):
+    LAYER_COLORS = ('skyblue', 'lime', '#dd4124', '#fa7268', '#0f4c81')
+
+    def __init__(self, batched: bool = True):
         self.fig_width = 15
         self.fig_height = 4
         self.background_color = '#28343B'
         self.bar_width_minutes = 3
+        self.batched = batched
+
+    def signature(self) -> dict:
+        return {
+            'size': [self.fig_width, self.fig_height],
+            'background': self.background_color,
+            'bar_width': self.bar_width_minutes,
+            'colors': list(self.LAYER_COLORS),
+        }
 
     def render(self, binned_data: Dict[datetime, BinData], time_range: TimeRange, output_path: str):
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(self.fig_width, self.fig_height))
         fig.set_facecolor(self.background_color)
         ax.set_facecolor(self.background_color)
@@ -81,7 +265,10 @@ class GraphRenderer:
         sorted_bins = sorted(binned_data.items())
         max_positive, max_negative = self._calculate_limits(sorted_bins)
 
-        self._draw_bars(ax, sorted_bins)
+        if self.batched:
+            self._draw_bars_batched(ax, sorted_bins)
+        else:
+            self._draw_bars(ax, sorted_bins)
         self._configure_axes(ax, time_range, max_positive, max_negative)
         self._save_figure(fig, output_path)
 
@@ -111,6 +298,43 @@ class GraphRenderer:
                 bottom_position = -(counts.red + counts.orange)
                 ax.bar(time_bin, -counts.dark_grey, bottom=bottom_position, color='#0f4c81', width=bar_width, align='edge')
 
+    def _draw_bars_batched(self, ax, sorted_bins):
+        import matplotlib.dates as mdates
+
+        if not sorted_bins:
+            return
+
+        times = [time_bin for time_bin, _ in sorted_bins]
+        counts = np.array(
+            [[c.blue, c.green, c.red, c.orange, c.dark_grey] for _, c in sorted_bins],
+            dtype=np.int64
+        )
+        blue, green, red, orange, dark_grey = counts.T
+        zeros = np.zeros_like(blue)
+
+        heights = np.column_stack([blue, green, -red, -orange, -dark_grey])
+        bottoms = np.column_stack([zeros, zeros, zeros, -red, -(red + orange)])
+        mask = counts > 0
+        if not mask.any():
+            return
+
+        # Row-major nonzero keeps the per-bin layer order of _draw_bars, so
+        # overlapping edges composite exactly as before. Widths are converted
+        # per bar, as a single-bar call would, to keep rectangles identical.
+        bin_index, layer_index = np.nonzero(mask)
+        bar_width = timedelta(minutes=self.bar_width_minutes)
+        starts = mdates.date2num(times)
+        widths = mdates.date2num([t + bar_width for t in times]) - starts
+
+        ax.bar(
+            [times[i] for i in bin_index],
+            heights[mask],
+            bottom=bottoms[mask],
+            color=[self.LAYER_COLORS[i] for i in layer_index],
+            width=widths[bin_index],
+            align='edge'
+        )
+
     def _configure_axes(self, ax, time_range: TimeRange, max_positive: int, max_negative: int):
         ax.axhline(0, color='grey', linewidth=2.5)
 
@@ -127,6 +351,8 @@ class GraphRenderer:
             ax.spines[spine].set_visible(False)
 
     def _save_figure(self, fig, output_path: str):
+        import matplotlib.pyplot as plt
+
         plt.tight_layout()
         fig.patch.set_alpha(0.0)
         os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
@@ -134,15 +360,287 @@ class GraphRenderer:
         plt.close(fig)
 
 
+class PersistentGraphRenderer(GraphRenderer):
+    def __init__(self):
+        super().__init__()
+        self.fig = None
+        self.ax = None
+        self.bars = []
+        self._laid_out = False
+
+    def render(self, binned_data: Dict[datetime, BinData], time_range: TimeRange, output_path: str):
+        sorted_bins = sorted(binned_data.items())
+        max_positive, max_negative = self._calculate_limits(sorted_bins)
+        self._update(sorted_bins, time_range, max_positive, max_negative)
+        self._save_frame(output_path)
+
+    def render_frames(self, binned_data: Dict[datetime, BinData], time_range: TimeRange,
+                      output_dir: str) -> List[str]:
+        sorted_bins = sorted(binned_data.items())
+        max_positive, max_negative = self._calculate_limits(sorted_bins)
+
+        output_paths = []
+        for frame in range(len(sorted_bins)):
+            output_path = os.path.join(output_dir, f'frame_{frame:04d}.png')
+            self._update(sorted_bins[:frame + 1], time_range, max_positive, max_negative)
+            self._save_frame(output_path)
+            output_paths.append(output_path)
+        return output_paths
+
+    def close(self):
+        if self.fig is not None:
+            import matplotlib.pyplot as plt
+            plt.close(self.fig)
+        self.fig = None
+        self.ax = None
+        self.bars = []
+        self._laid_out = False
+
+    def _ensure_figure(self, time_range: TimeRange):
+        if self.fig is not None:
+            return
+
+        import matplotlib.pyplot as plt
+
+        self.fig, self.ax = plt.subplots(figsize=(self.fig_width, self.fig_height))
+        self.fig.set_facecolor(self.background_color)
+        self.ax.set_facecolor(self.background_color)
+        self._configure_axes(self.ax, time_range, 0, 0)
+
+    def _update(self, sorted_bins, time_range: TimeRange, max_positive: int, max_negative: int):
+        self._ensure_figure(time_range)
+
+        x, widths, heights, bottoms, colors = self._bar_geometry(sorted_bins)
+        self._ensure_bars(len(x))
+
+        for i, bar in enumerate(self.bars):
+            if i >= len(x):
+                bar.set_visible(False)
+                continue
+            bar.set_x(x[i])
+            bar.set_width(widths[i])
+            bar.set_y(bottoms[i])
+            bar.set_height(heights[i])
+            bar.set_facecolor(colors[i])
+            bar.set_visible(True)
+
+        if max_positive == 0 and max_negative == 0:
+            self.ax.set_ylim(-3, 3)
+        else:
+            self.ax.set_ylim(-(max_negative + 1), max_positive + 1)
+        self.ax.set_xlim(time_range.start, time_range.end)
+
+    def _bar_geometry(self, sorted_bins):
+        import matplotlib.dates as mdates
+
+        if not sorted_bins:
+            return [], [], [], [], []
+
+        times = [time_bin for time_bin, _ in sorted_bins]
+        counts = np.array(
+            [[c.blue, c.green, c.red, c.orange, c.dark_grey] for _, c in sorted_bins],
+            dtype=np.int64
+        )
+        blue, green, red, orange, dark_grey = counts.T
+        zeros = np.zeros_like(blue)
+
+        heights = np.column_stack([blue, green, -red, -orange, -dark_grey])
+        bottoms = np.column_stack([zeros, zeros, zeros, -red, -(red + orange)])
+        mask = counts > 0
+
+        bin_index, layer_index = np.nonzero(mask)
+        bar_width = timedelta(minutes=self.bar_width_minutes)
+        starts = mdates.date2num(times)
+        widths = mdates.date2num([t + bar_width for t in times]) - starts
+
+        return (
+            starts[bin_index],
+            widths[bin_index],
+            heights[mask],
+            bottoms[mask],
+            [self.LAYER_COLORS[i] for i in layer_index],
+        )
+
+    def _ensure_bars(self, count: int):
+        missing = count - len(self.bars)
+        if missing <= 0:
+            return
+        container = self.ax.bar(np.zeros(missing), np.zeros(missing), width=0, align='edge')
+        self.bars.extend(container.patches)
+
+    def _save_frame(self, output_path: str):
+        if not self._laid_out:
+            self.fig.tight_layout()
+            self.fig.patch.set_alpha(0.0)
+            self._laid_out = True
+        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
+        self.fig.savefig(output_path, transparent=True)
+
+
+class DirectGraphRenderer(GraphRenderer):
+    DPI = 100
+    PAD = 15
+    NAMED_COLORS = {'skyblue': '#87ceeb', 'lime': '#00ff00', 'grey': '#808080'}
+    AXIS_COLOR = 'grey'
+    AXIS_LINEWIDTH = 2.5
+
+    def __init__(self):
+        super().__init__()
+        self.width = int(self.fig_width * self.DPI)
+        self.height = int(self.fig_height * self.DPI)
+
+    def close(self):
+        pass
+
+    def _hex(self, color: str) -> str:
+        return self.NAMED_COLORS.get(color, color)
+
+    def _layout(self, binned_data: Dict[datetime, BinData], time_range: TimeRange):
+        sorted_bins = sorted(binned_data.items())
+        max_positive, max_negative = self._calculate_limits(sorted_bins)
+        if max_positive == 0 and max_negative == 0:
+            y_min, y_max = -3, 3
+        else:
+            y_min, y_max = -(max_negative + 1), max_positive + 1
+
+        left, top = self.PAD, self.PAD
+        right, bottom = self.width - self.PAD, self.height - self.PAD
+        span = (time_range.end - time_range.start).total_seconds() or 1.0
+        bar_seconds = self.bar_width_minutes * 60
+
+        def to_x(seconds: float) -> float:
+            return min(max(left + seconds / span * (right - left), left), right)
+
+        def to_y(value: float) -> float:
+            return top + (y_max - value) / (y_max - y_min) * (bottom - top)
+
+        rects = []
+        for time_bin, c in sorted_bins:
+            offset = (time_bin - time_range.start).total_seconds()
+            x0, x1 = to_x(offset), to_x(offset + bar_seconds)
+            if x1 <= x0:
+                continue
+            layers = (
+                (c.blue, 0, c.blue),
+                (c.green, 0, c.green),
+                (c.red, -c.red, 0),
+                (c.orange, -(c.red + c.orange), -c.red),
+                (c.dark_grey, -(c.red + c.orange + c.dark_grey), -(c.red + c.orange)),
+            )
+            for color, (count, low, high) in zip(self.LAYER_COLORS, layers):
+                if count > 0:
+                    rects.append((x0, to_y(high), x1, to_y(low), self._hex(color)))
+
+        axis_thickness = self.AXIS_LINEWIDTH * self.DPI / 72
+        return rects, (left, right), to_y(0), axis_thickness
+
+
+class SvgGraphRenderer(DirectGraphRenderer):
+    def render(self, binned_data: Dict[datetime, BinData], time_range: TimeRange, output_path: str):
+        rects, (left, right), axis_y, axis_thickness = self._layout(binned_data, time_range)
+
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+            f'viewBox="0 0 {self.width} {self.height}">',
+            '<g shape-rendering="crispEdges">',
+        ]
+        parts.extend(
+            f'<rect x="{x0:.2f}" y="{y0:.2f}" width="{x1 - x0:.2f}" height="{y1 - y0:.2f}" fill="{color}"/>'
+            for x0, y0, x1, y1, color in rects
+        )
+        parts.append('</g>')
+        parts.append(
+            f'<line x1="{left}" y1="{axis_y:.2f}" x2="{right}" y2="{axis_y:.2f}" '
+            f'stroke="{self._hex(self.AXIS_COLOR)}" stroke-width="{axis_thickness:.2f}"/>'
+        )
+        parts.append('</svg>')
+
+        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(parts))
+            f.write('\n')
+
+
+class RasterGraphRenderer(DirectGraphRenderer):
+    def __init__(self):
+        try:
+            from PIL import Image
+        except ImportError:
+            raise ValueError("raster backend requested but Pillow is not installed")
+        super().__init__()
+        self._image = Image
+
+    @staticmethod
+    def _rgba(color: str) -> Tuple[int, int, int, int]:
+        color = color.lstrip('#')
+        return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16), 255
+
+    def render(self, binned_data: Dict[datetime, BinData], time_range: TimeRange, output_path: str):
+        rects, (left, right), axis_y, axis_thickness = self._layout(binned_data, time_range)
+
+        pixels = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+        for x0, y0, x1, y1, color in rects:
+            pixels[round(y0):round(y1), round(x0):round(x1)] = self._rgba(color)
+
+        half = axis_thickness / 2
+        pixels[round(axis_y - half):round(axis_y + half), left:right] = self._rgba(self._hex(self.AXIS_COLOR))
+
+        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
+        self._image.fromarray(pixels, 'RGBA').save(output_path)
+
+
+class RenderManifest:
+    FILE_NAME = '.render_manifest.json'
+
+    def __init__(self, output_dir: str):
+        self.path = os.path.join(output_dir, self.FILE_NAME)
+        self.entries: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def digest(bin_starts: np.ndarray, counts: np.ndarray, params: dict) -> str:
+        h = hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8'))
+        for array in (np.ascontiguousarray(bin_starts, dtype=np.int64), np.ascontiguousarray(counts, dtype=np.int64)):
+            h.update(str(array.shape).encode('ascii'))
+            h.update(array.tobytes())
+        return h.hexdigest()
+
+    def is_current(self, output_path: str, digest: str) -> bool:
+        return self.entries.get(os.path.basename(output_path)) == digest and os.path.isfile(output_path)
+
+    def update(self, output_path: str, digest: str):
+        self.entries[os.path.basename(output_path)] = digest
+
+    def save(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
 class GraphBuilder:
+    BACKENDS = ('matplotlib', 'svg', 'raster')
+
     def __init__(self):
         self.submissions: List[Submission] = []
         self.time_range: Optional[TimeRange] = None
         self.freeze_time: Optional[datetime] = None
         self.minute_delta = 3
         self.output_path = 'graph.png'
+        self.output_dir = 'images'
+        self.jobs = 1
+        self.force = False
+        self.backend = 'matplotlib'
+        self.skipped: List[str] = []
 
-    def with_submissions(self, submissions: List[Submission]):
+    def with_submissions(self, submissions: Union[List[Submission], SubmissionTable]):
         self.submissions = submissions
         return self
 
@@ -166,6 +664,39 @@ class GraphBuilder:
         self.output_path = output_path
         return self
 
+    def with_output_dir(self, output_dir: str):
+        self.output_dir = output_dir
+        return self
+
+    def with_jobs(self, jobs: int):
+        self.jobs = max(1, jobs)
+        return self
+
+    def with_force(self, force: bool):
+        self.force = force
+        return self
+
+    def with_backend(self, backend: str):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown render backend: {backend}")
+        self.backend = backend
+        return self
+
+    def create_renderer(self) -> GraphRenderer:
+        if self.backend == 'svg':
+            return SvgGraphRenderer()
+        if self.backend == 'raster':
+            return RasterGraphRenderer()
+        return PersistentGraphRenderer()
+
+    @staticmethod
+    def output_path_for(output_dir: str, problem_no: str, extension: str = 'png') -> str:
+        safe_name = problem_no.replace('/', '_')
+        return os.path.join(output_dir, f'status_{safe_name}.{extension}')
+
+    def problem_output_path(self, problem_no: str) -> str:
+        return self.output_path_for(self.output_dir, problem_no, 'svg' if self.backend == 'svg' else 'png')
+
     def build(self):
         if not self.submissions:
             raise ValueError("No submissions provided")
@@ -176,29 +707,362 @@ class GraphBuilder:
         binner = SubmissionBinner(self.minute_delta, self.freeze_time)
         binned_data = binner.bin_submissions(self.submissions)
 
-        renderer = GraphRenderer()
+        renderer = GraphRenderer() if self.backend == 'matplotlib' else self.create_renderer()
         renderer.render(binned_data, self.time_range, self.output_path)
 
+    def build_all(self, problems: List[str],
+                  problem_callback: Optional[Callable[[str], None]] = None,
+                  skip_callback: Optional[Callable[[str], None]] = None) -> List[str]:
+        if not self.submissions:
+            raise ValueError("No submissions provided")
+
+        table = self.submissions
+        if not isinstance(table, SubmissionTable):
+            table = SubmissionTable.from_submissions(table)
+
+        if not self.time_range:
+            self.time_range = TimeRange.from_timestamps(table.timestamps(), self.minute_delta)
+
+        present = [p for p in dict.fromkeys(problems) if table.code_of('problem_no', p) is not None]
+        binner = SubmissionBinner(self.minute_delta, self.freeze_time)
+        binned = binner.bin_table(table, present)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = RenderManifest(self.output_dir)
+        params = self.render_params()
+        output_paths = []
+        digests = {}
+        tasks = []
+        self.skipped = []
+        for group_index, problem_no in enumerate(binned.groups):
+            output_path = self.problem_output_path(problem_no)
+            bin_starts, counts = binned.compact(group_index)
+            digest = RenderManifest.digest(bin_starts, counts, params)
+            output_paths.append(output_path)
+            if not self.force and manifest.is_current(output_path, digest):
+                self.skipped.append(problem_no)
+                if skip_callback:
+                    skip_callback(problem_no)
+                continue
+            digests[output_path] = digest
+            tasks.append((problem_no, output_path, (bin_starts, counts)))
+
+        def rendered(problem_no: str, output_path: str):
+            manifest.update(output_path, digests[output_path])
+            if problem_callback:
+                problem_callback(problem_no)
+
+        try:
+            if self.backend == 'matplotlib' and self.jobs > 1 and len(tasks) > 1:
+                self._render_parallel(tasks, rendered)
+            elif tasks:
+                self._render_serial(tasks, rendered)
+        finally:
+            if digests:
+                manifest.save()
+
+        return output_paths
+
+    def render_params(self) -> dict:
+        return {
+            'time_range': [self.time_range.start.isoformat(), self.time_range.end.isoformat()],
+            'freeze_time': self.freeze_time.isoformat() if self.freeze_time else None,
+            'minute_delta': self.minute_delta,
+            'backend': self.backend,
+            'renderer': GraphRenderer().signature(),
+        }
+
+    def _render_serial(self, tasks, rendered: Callable[[str, str], None]):
+        renderer = self.create_renderer()
+        try:
+            for problem_no, output_path, (bin_starts, counts) in tasks:
+                renderer.render(BinnedCounts.to_dict(bin_starts, counts), self.time_range, output_path)
+                rendered(problem_no, output_path)
+        finally:
+            renderer.close()
+
+    def build_timelapse(self, problem_no: str, output_dir: str) -> List[str]:
+        if not self.submissions:
+            raise ValueError("No submissions provided")
+
+        table = self.submissions
+        if not isinstance(table, SubmissionTable):
+            table = SubmissionTable.from_submissions(table)
+
+        if not self.time_range:
+            self.time_range = TimeRange.from_timestamps(table.timestamps(), self.minute_delta)
+
+        binner = SubmissionBinner(self.minute_delta, self.freeze_time)
+        binned = binner.bin_table(table, [problem_no])
+        if not binned.groups:
+            raise ValueError(f"No submissions for problem {problem_no}")
+
+        bin_starts, counts = binned.compact(0)
+        renderer = PersistentGraphRenderer()
+        try:
+            return renderer.render_frames(BinnedCounts.to_dict(bin_starts, counts), self.time_range, output_dir)
+        finally:
+            renderer.close()
+
+    def _render_parallel(self, tasks, rendered: Callable[[str, str], None]):
+        context = multiprocessing.get_context('spawn')
+        workers = min(self.jobs, len(tasks))
+        time_range = (self.time_range.start, self.time_range.end)
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_render_worker) as executor:
+            futures = {
+                executor.submit(_render_problem, bin_starts, counts, time_range, output_path): problem_no
+                for problem_no, output_path, (bin_starts, counts) in tasks
+            }
+            for future in as_completed(futures):
+                rendered(futures[future], future.result())
+
+
+_worker_renderer: Optional[PersistentGraphRenderer] = None
+
+
+def _init_render_worker():
+    global _worker_renderer
+    import matplotlib
+
+    matplotlib.use('Agg')
+    _worker_renderer = PersistentGraphRenderer()
+
+
+def _render_problem(bin_starts: np.ndarray, counts: np.ndarray, time_range: tuple, output_path: str):
+    _worker_renderer.render(BinnedCounts.to_dict(bin_starts, counts), TimeRange(*time_range), output_path)
+    return output_path
+
+
+class SubmissionQuery:
+    TIMESTAMP_KEY = b'"submitted_at"'
+
+    def __init__(self, columns: Optional[Iterable[str]] = None, problems: Optional[Iterable[str]] = None,
+                 time_range: Optional[TimeRange] = None):
+        self.columns = None if columns is None else set(columns)
+        self.problems = None if problems is None else set(problems)
+        self.time_range = time_range
+        self.start_ts = datetime_to_timestamp(time_range.start) if time_range else None
+        self.end_ts = datetime_to_timestamp(time_range.end) if time_range else None
+        self._problem_patterns = self._build_problem_patterns(self.problems)
+        self._start_bytes = time_range.start.strftime('%Y-%m-%d %H:%M:%S').encode('ascii') if time_range else None
+        self._end_bytes = time_range.end.strftime('%Y-%m-%d %H:%M:%S').encode('ascii') if time_range else None
+
+    @staticmethod
+    def _build_problem_patterns(problems: Optional[set]) -> Optional[List[bytes]]:
+        if problems is None:
+            return None
+        patterns = set()
+        for problem_no in problems:
+            for ensure_ascii in (False, True):
+                value = json.dumps(problem_no, ensure_ascii=ensure_ascii).encode('utf-8')
+                patterns.add(b'"problem_no":' + value)
+                patterns.add(b'"problem_no": ' + value)
+        return sorted(patterns)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.columns is None and self.problems is None and self.time_range is None
+
+    def fields(self) -> Optional[List[str]]:
+        if self.columns is None:
+            return None
+        fields = set(self.columns)
+        if self.problems is not None:
+            fields.add('problem_no')
+        if self.time_range is not None:
+            fields.add('submitted_at')
+        return sorted(fields)
+
+    def matches_raw(self, line: bytes) -> bool:
+        if self._problem_patterns is not None and not any(p in line for p in self._problem_patterns):
+            return False
+        if self._start_bytes is not None:
+            value = self._raw_timestamp(line)
+            if value is not None and not self._start_bytes <= value <= self._end_bytes:
+                return False
+        return True
+
+    def _raw_timestamp(self, line: bytes) -> Optional[bytes]:
+        key = line.find(self.TIMESTAMP_KEY)
+        if key < 0:
+            return None
+        quote = line.find(b'"', line.find(b':', key + len(self.TIMESTAMP_KEY)) + 1)
+        value = line[quote + 1:quote + 20]
+        if len(value) != 19 or value[4:5] != b'-' or value[10:11] != b' ' or value[13:14] != b':':
+            return None
+        return value
+
+    def matches(self, data: dict) -> bool:
+        if self.problems is not None and data.get('problem_no') not in self.problems:
+            return False
+        if self.time_range is not None:
+            ts = parse_timestamp(data.get('submitted_at'))
+            if ts is None or not self.start_ts <= ts <= self.end_ts:
+                return False
+        return True
+
+    def build(self, data: dict) -> Submission:
+        if self.columns is None:
+            return Submission(**data)
+        values = {field: (data.get(field) if field in self.columns else None) for field in Submission.FIELDS}
+        return Submission(**values)
+
 
 class SubmissionRepository:
+    ARROW_EXTENSIONS = ('.parquet', '.arrow', '.feather')
+    GRAPH_COLUMNS = ('problem_no', 'result', 'submitted_at')
+
     @staticmethod
-    def load_from_jsonl(path: str) -> List[Submission]:
+    def load_from_jsonl(path: str, query: Optional[SubmissionQuery] = None) -> List[Submission]:
+        query = query or SubmissionQuery()
         submissions = []
-        with open(path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    submission = Submission(**data)
-                    submissions.append(submission)
-                except Exception:
-                    continue
+        for data in SubmissionRepository._jsonl_records(path, query):
+            try:
+                if query.matches(data):
+                    submissions.append(query.build(data))
+            except Exception:
+                continue
         return submissions
 
     @staticmethod
-    def group_by_problem(submissions: List[Submission]) -> Dict[str, List[Submission]]:
+    def _jsonl_records(path: str, query: SubmissionQuery) -> Iterator[dict]:
+        reader = JsonlReader(path)
+        if query.problems is None and query.time_range is None:
+            return reader.read()
+
+        lines = None
+        index = JsonlIndex.load(path)
+        if index is not None:
+            if query.problems is not None:
+                lines = index.read_lines(index.offsets_for(query.problems))
+            else:
+                lines = index.read_ranges(index.ranges_for(query.start_ts, query.end_ts))
+        if lines is None:
+            lines = reader.lines()
+        return JsonlReader.parse(line for line in lines if query.matches_raw(line))
+
+    @staticmethod
+    def time_bounds(path: str, contest_id: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        if path.endswith('.jsonl'):
+            index = JsonlIndex.open(path)
+            return None if index.min_ts is None else (index.min_ts, index.max_ts)
+        times = [s.submitted_ts for s in SubmissionRepository.load(path, columns=['submitted_at'], contest_id=contest_id)
+                 if s.submitted_ts is not None]
+        return (min(times), max(times)) if times else None
+
+    @staticmethod
+    def load_from_sqlite(path: str, problems: Optional[List[str]] = None,
+                         query: Optional[SubmissionQuery] = None,
+                         contest_id: Optional[str] = None) -> List[Submission]:
+        if query is not None and query.problems is not None:
+            problems = sorted(query.problems)
+        store = SqliteCacheStrategy(path)
+        try:
+            submissions = store.load_submissions(problems, contest_id)
+        finally:
+            store.close()
+        if query is None or query.is_empty:
+            return submissions
+        records = (submission.to_dict() for submission in submissions)
+        return [query.build(data) for data in records if query.matches(data)]
+
+    @staticmethod
+    def load_from_arrow(path: str, columns: Optional[Iterable[str]] = None,
+                        query: Optional[SubmissionQuery] = None) -> SubmissionTable:
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError:
+            raise ValueError("parquet/arrow input requested but pyarrow is not installed")
+
+        query = query or SubmissionQuery(columns)
+        wanted = query.fields()
+        if path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            available = pq.read_schema(path, memory_map=True).names
+            selected = [name for name in available if wanted is None or name in wanted]
+            table = pq.read_table(path, columns=selected, memory_map=True)
+        else:
+            import pyarrow.feather as feather
+            with pa.memory_map(path) as source:
+                available = pa.ipc.open_file(source).schema.names
+            selected = [name for name in available if wanted is None or name in wanted]
+            table = feather.read_table(path, columns=selected, memory_map=True)
+
+        if query.problems is not None and 'problem_no' in table.column_names:
+            problem_column = table.column('problem_no')
+            if pa.types.is_dictionary(problem_column.type):
+                problem_column = problem_column.cast(pa.string())
+            table = table.filter(pc.is_in(problem_column, value_set=pa.array(sorted(query.problems), pa.string())))
+        if query.time_range is not None and 'submitted_at' in table.column_names:
+            seconds = table.column('submitted_at').cast(pa.timestamp('s')).cast(pa.int64())
+            table = table.filter(pc.and_(pc.greater_equal(seconds, query.start_ts),
+                                         pc.less_equal(seconds, query.end_ts)))
+        if query.columns is not None:
+            table = table.select([name for name in table.column_names if name in query.columns])
+        table = table.unify_dictionaries()
+
+        numeric = {}
+        for name in SubmissionTable.NUMERIC:
+            source = 'submitted_at' if name == 'submitted_ts' else name
+            if source not in table.column_names:
+                continue
+            column = table.column(source)
+            if pa.types.is_timestamp(column.type):
+                column = column.cast(pa.timestamp('s'))
+            column = column.cast(pa.int64())
+            values = pc.fill_null(column, SubmissionTable.NULL).to_numpy()
+            numeric[name] = SubmissionRepository._to_array('q', values, np.int64)
+
+        categorical = {}
+        for name in SubmissionTable.CATEGORICAL:
+            if name not in table.column_names:
+                continue
+            column = table.column(name).combine_chunks()
+            if not pa.types.is_dictionary(column.type):
+                column = column.dictionary_encode()
+            dictionary = column.dictionary.to_pylist()
+            indices = column.indices
+            if indices.null_count:
+                if '' not in dictionary:
+                    dictionary.append('')
+                indices = pc.fill_null(indices, dictionary.index(''))
+            categorical[name] = (SubmissionRepository._to_array('i', indices.to_numpy(), np.int32), dictionary)
+
+        source_urls = table.column('source_url').to_pylist() if 'source_url' in table.column_names else None
+        return SubmissionTable.from_columns(table.num_rows, numeric, categorical, source_urls)
+
+    @staticmethod
+    def _to_array(typecode: str, values: np.ndarray, dtype) -> array:
+        result = array(typecode)
+        result.frombytes(np.ascontiguousarray(values, dtype=dtype).tobytes())
+        return result
+
+    @staticmethod
+    def load_table(path: str, columns: Optional[Iterable[str]] = None, problems: Optional[Iterable[str]] = None,
+                   time_range: Optional[TimeRange] = None, contest_id: Optional[str] = None) -> SubmissionTable:
+        query = SubmissionQuery(columns, problems, time_range)
+        if path.endswith(SubmissionRepository.ARROW_EXTENSIONS):
+            return SubmissionRepository.load_from_arrow(path, query=query)
+        return SubmissionTable.from_submissions(SubmissionRepository._load(path, query, contest_id))
+
+    @staticmethod
+    def load(path: str, columns: Optional[Iterable[str]] = None, problems: Optional[Iterable[str]] = None,
+             time_range: Optional[TimeRange] = None, contest_id: Optional[str] = None) -> List[Submission]:
+        return SubmissionRepository._load(path, SubmissionQuery(columns, problems, time_range), contest_id)
+
+    @staticmethod
+    def _load(path: str, query: SubmissionQuery, contest_id: Optional[str] = None) -> List[Submission]:
+        if path.endswith(('.db', '.sqlite', '.sqlite3')):
+            return SubmissionRepository.load_from_sqlite(path, query=query, contest_id=contest_id)
+        if path.endswith(SubmissionRepository.ARROW_EXTENSIONS):
+            return list(SubmissionRepository.load_from_arrow(path, query=query))
+        return SubmissionRepository.load_from_jsonl(path, query)
+
+    @staticmethod
+    def group_by_problem(submissions: Iterable[Submission]) -> Dict[str, List[Submission]]:
         grouped = defaultdict(list)
         for submission in submissions:
             if submission.problem_no:
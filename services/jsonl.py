@@ -0,0 +1,312 @@
+import os
+import json
+import mmap
+import zlib
+import base64
+from array import array
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
+
+from domain import Submission, parse_timestamp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+json_loads: Callable[[Any], Any] = orjson.loads if orjson is not None else json.loads
+
+
+class JsonlReader:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def read(self, start: int = 0, end: Optional[int] = None) -> Generator[dict, None, None]:
+        with self._map() as mm:
+            view = memoryview(mm) if orjson is not None else mm
+            try:
+                for line_start, line_end in self._spans(mm, start, end):
+                    try:
+                        record = json_loads(view[line_start:line_end])
+                    except Exception:
+                        continue
+                    yield record
+            finally:
+                if isinstance(view, memoryview):
+                    view.release()
+
+    def lines(self, start: int = 0, end: Optional[int] = None) -> Generator[bytes, None, None]:
+        with self._map() as mm:
+            for line_start, line_end in self._spans(mm, start, end):
+                yield mm[line_start:line_end]
+
+    @staticmethod
+    def parse(lines: Iterable[bytes]) -> Generator[dict, None, None]:
+        for line in lines:
+            try:
+                record = json_loads(line)
+            except Exception:
+                continue
+            yield record
+
+    @staticmethod
+    def _spans(mm, start: int, end: Optional[int]) -> Iterator[Tuple[int, int]]:
+        end = len(mm) if end is None else min(end, len(mm))
+        position = start
+        while position < end:
+            newline = mm.find(b'\n', position, end)
+            if newline < 0:
+                newline = end
+            if newline > position:
+                yield position, newline
+            position = newline + 1
+
+    @contextmanager
+    def _map(self):
+        with open(self.file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b''
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+
+class JsonlWriter:
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, file_path: str, append: bool = False, atomic: bool = False,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE, serializer: str = 'auto'):
+        if append and atomic:
+            raise ValueError("append and atomic modes cannot be combined")
+
+        self.file_path = file_path
+        self.append = append
+        self.atomic = atomic
+        self.buffer_size = buffer_size
+        self._dumps = self._select_serializer(serializer)
+        self._target_path = f'{file_path}.tmp' if atomic else file_path
+        self._file = None
+
+    @staticmethod
+    def _select_serializer(serializer: str) -> Callable[[Any], bytes]:
+        if serializer == 'auto':
+            serializer = 'orjson' if orjson is not None else 'json'
+        if serializer == 'orjson':
+            if orjson is None:
+                raise ValueError("orjson serializer requested but orjson is not installed")
+            return orjson.dumps
+        if serializer == 'json':
+            return lambda record: json.dumps(record, ensure_ascii=False).encode('utf-8')
+        raise ValueError(f"Unknown serializer: {serializer}")
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def open(self):
+        parent = os.path.dirname(os.path.abspath(self.file_path))
+        os.makedirs(parent, exist_ok=True)
+        self._file = open(self._target_path, 'ab' if self.append else 'wb', buffering=self.buffer_size)
+
+    def write_batch(self, records: Iterable[Any]):
+        dumps = self._dumps
+        lines = [dumps(r.to_dict() if hasattr(r, 'to_dict') else r) for r in records]
+        if lines:
+            lines.append(b'')
+            self._file.write(b'\n'.join(lines))
+
+    def write(self, record: Any):
+        self.write_batch((record,))
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def checkpoint(self) -> int:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self):
+        if self._file is None:
+            return
+        if self.atomic:
+            self.checkpoint()
+        self._file.close()
+        self._file = None
+        if self.atomic:
+            os.replace(self._target_path, self.file_path)
+
+    def abort(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        if self.atomic and os.path.isfile(self._target_path):
+            os.remove(self._target_path)
+
+
+class JsonlIndex:
+    VERSION = 2
+    SUFFIX = '.idx'
+    BUCKET_SECONDS = 3600
+
+    def __init__(self, jsonl_path: str, size: int, mtime_ns: int, rows: int,
+                 min_ts: Optional[int], max_ts: Optional[int], max_submission_id: Optional[int],
+                 min_pending_id: Optional[int], problems: Dict[str, array],
+                 buckets: Dict[int, Tuple[int, int]]):
+        self.jsonl_path = jsonl_path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.rows = rows
+        self.min_ts = min_ts
+        self.max_ts = max_ts
+        self.max_submission_id = max_submission_id
+        self.min_pending_id = min_pending_id
+        self.problems = problems
+        self.buckets = buckets
+
+    @classmethod
+    def index_path(cls, jsonl_path: str) -> str:
+        return f'{jsonl_path}{cls.SUFFIX}'
+
+    @classmethod
+    def open(cls, jsonl_path: str) -> 'JsonlIndex':
+        index = cls.load(jsonl_path)
+        if index is None:
+            index = cls.build(jsonl_path)
+            index.save()
+        return index
+
+    @classmethod
+    def load(cls, jsonl_path: str) -> Optional['JsonlIndex']:
+        try:
+            with open(cls.index_path(jsonl_path), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            stat = os.stat(jsonl_path)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != cls.VERSION or data.get('size') != stat.st_size \
+                or data.get('mtime_ns') != stat.st_mtime_ns:
+            return None
+
+        return cls(
+            jsonl_path, data['size'], data['mtime_ns'], data['rows'],
+            data['min_ts'], data['max_ts'], data['max_submission_id'], data['min_pending_id'],
+            {problem_no: cls._decode_offsets(encoded) for problem_no, encoded in data['problems'].items()},
+            {int(bucket): (start, end) for bucket, (start, end) in data['buckets'].items()}
+        )
+
+    @classmethod
+    def build(cls, jsonl_path: str) -> 'JsonlIndex':
+        stat = os.stat(jsonl_path)
+        rows = 0
+        min_ts = max_ts = max_submission_id = min_pending_id = None
+        problems: Dict[str, array] = {}
+        buckets: Dict[int, Tuple[int, int]] = {}
+
+        reader = JsonlReader(jsonl_path)
+        with reader._map() as mm:
+            for start, end in reader._spans(mm, 0, None):
+                offset = min(end + 1, len(mm))
+                try:
+                    record = json_loads(mm[start:end])
+                except Exception:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                rows += 1
+
+                problem_no = record.get('problem_no')
+                if isinstance(problem_no, str):
+                    problems.setdefault(problem_no, array('q')).append(start)
+
+                submission_id = record.get('submission_id')
+                if isinstance(submission_id, int) and (max_submission_id is None or submission_id > max_submission_id):
+                    max_submission_id = submission_id
+                if isinstance(submission_id, int) and Submission.is_pending(record.get('result')) \
+                        and (min_pending_id is None or submission_id < min_pending_id):
+                    min_pending_id = submission_id
+
+                ts = parse_timestamp(record.get('submitted_at'))
+                if ts is None:
+                    continue
+                min_ts = ts if min_ts is None else min(min_ts, ts)
+                max_ts = ts if max_ts is None else max(max_ts, ts)
+                bucket = ts - ts % cls.BUCKET_SECONDS
+                first, last = buckets.get(bucket, (start, offset))
+                buckets[bucket] = (min(first, start), max(last, offset))
+
+        return cls(jsonl_path, stat.st_size, stat.st_mtime_ns, rows, min_ts, max_ts, max_submission_id,
+                   min_pending_id, problems, buckets)
+
+    def save(self):
+        data = {
+            'version': self.VERSION,
+            'size': self.size,
+            'mtime_ns': self.mtime_ns,
+            'rows': self.rows,
+            'min_ts': self.min_ts,
+            'max_ts': self.max_ts,
+            'max_submission_id': self.max_submission_id,
+            'min_pending_id': self.min_pending_id,
+            'problems': {problem_no: self._encode_offsets(offsets) for problem_no, offsets in self.problems.items()},
+            'buckets': {str(bucket): list(span) for bucket, span in sorted(self.buckets.items())},
+        }
+        path = self.index_path(self.jsonl_path)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _encode_offsets(offsets: array) -> str:
+        deltas = array('q', offsets)
+        for i in range(len(deltas) - 1, 0, -1):
+            deltas[i] -= deltas[i - 1]
+        return base64.b64encode(zlib.compress(deltas.tobytes())).decode('ascii')
+
+    @staticmethod
+    def _decode_offsets(encoded: str) -> array:
+        offsets = array('q')
+        offsets.frombytes(zlib.decompress(base64.b64decode(encoded)))
+        for i in range(1, len(offsets)):
+            offsets[i] += offsets[i - 1]
+        return offsets
+
+    def offsets_for(self, problems: Iterable[str]) -> List[int]:
+        offsets = []
+        for problem_no in problems:
+            offsets.extend(self.problems.get(problem_no, ()))
+        offsets.sort()
+        return offsets
+
+    def ranges_for(self, start_ts: int, end_ts: int) -> List[Tuple[int, int]]:
+        first_bucket = start_ts - start_ts % self.BUCKET_SECONDS
+        spans = sorted(span for bucket, span in self.buckets.items() if first_bucket <= bucket <= end_ts)
+        merged: List[Tuple[int, int]] = []
+        for start, end in spans:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def read_lines(self, offsets: Iterable[int]) -> Iterator[bytes]:
+        with open(self.jsonl_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield f.readline()
+
+    def read_ranges(self, ranges: Iterable[Tuple[int, int]]) -> Iterator[bytes]:
+        with open(self.jsonl_path, 'rb') as f:
+            for start, end in ranges:
+                f.seek(start)
+                yield from f.read(end - start).splitlines()
@@ -0,0 +1,153 @@
+import os
+import time
+import threading
+import requests
+from typing import Callable, List, Optional
+
+from domain import Submission, SubmissionTable, datetime_to_timestamp
+from .cache import SqliteCacheStrategy
+from .crawler import BojCrawler
+from .graph_builder import (
+    GraphBuilder, GraphRenderer, IncrementalBinner, RenderManifest, SubmissionBinner,
+    SubmissionRepository, TimeRange, BinnedCounts
+)
+
+
+class LiveDashboard:
+    HISTORY_COLUMNS = SubmissionRepository.GRAPH_COLUMNS + ('submission_id',)
+
+    def __init__(self, crawler: BojCrawler, builder: GraphBuilder, start_url: str, problems: List[str],
+                 interval: float = 10.0, max_catchup_pages: int = 10):
+        self.crawler = crawler
+        self.builder = builder
+        self.start_url = start_url
+        self.problems = list(dict.fromkeys(problems))
+        self.interval = interval
+        self.max_catchup_pages = max_catchup_pages
+        self.binner: Optional[IncrementalBinner] = None
+        self.renderer: Optional[GraphRenderer] = None
+        self.manifest: Optional[RenderManifest] = None
+        self.progress_callback: Optional[Callable[[str], None]] = None
+
+    def set_progress_callback(self, callback: Callable[[str], None]):
+        self.progress_callback = callback
+
+    def _log(self, message: str):
+        if self.progress_callback:
+            self.progress_callback(message)
+
+    def seed(self, history_path: Optional[str] = None) -> List[str]:
+        started_at = time.time()
+        table = SubmissionTable()
+        if history_path and os.path.isfile(history_path):
+            table = SubmissionRepository.load_table(history_path, self.HISTORY_COLUMNS, self.problems,
+                                                    contest_id=SqliteCacheStrategy.contest_id_of(self.start_url))
+
+        if not self.builder.time_range:
+            timestamps = table.timestamps()
+            if not timestamps:
+                raise ValueError("시간 범위를 지정하거나 이전 제출 기록을 제공해야 합니다.")
+            self.builder.time_range = TimeRange.from_timestamps(timestamps, self.builder.minute_delta)
+
+        binner = SubmissionBinner(self.builder.minute_delta, self.builder.freeze_time)
+        self.binner = IncrementalBinner.from_table(binner, table, self.problems)
+        self._log(f"[실시간] 이전 기록: {len(table)}개, 마지막 제출 번호: {self.binner.known_max_id}, "
+                  f"경과시간: {time.time() - started_at:.2f}초")
+
+        os.makedirs(self.builder.output_dir, exist_ok=True)
+        self.manifest = RenderManifest(self.builder.output_dir)
+        self.renderer = self.builder.create_renderer()
+        return self._render(self.problems)
+
+    def poll(self) -> List[str]:
+        if self.binner is None:
+            self.seed()
+
+        started_at = time.time()
+        submissions = self._fetch_new()
+        changed = self.binner.update(submissions)
+        rendered = self._render(changed)
+
+        elapsed = time.time() - started_at
+        if rendered:
+            self._log(f"[실시간] 제출: {len(submissions)}개, 갱신: {', '.join(rendered)}, 경과시간: {elapsed:.2f}초")
+        else:
+            self._log(f"[실시간] 변경 없음, 경과시간: {elapsed:.2f}초")
+        return rendered
+
+    def run(self, max_polls: Optional[int] = None, stop_event: Optional[threading.Event] = None):
+        stop_event = stop_event or threading.Event()
+        polls = 0
+        try:
+            while not stop_event.is_set():
+                try:
+                    self.poll()
+                except requests.RequestException as e:
+                    self._log(f"[오류] {e}")
+                polls += 1
+                if max_polls is not None and polls >= max_polls:
+                    break
+                stop_event.wait(self.interval)
+        finally:
+            self.close()
+
+    def close(self):
+        if self.renderer is not None:
+            self.renderer.close()
+            self.renderer = None
+        self.crawler.http_client.close()
+
+    def _fetch_new(self) -> List[Submission]:
+        submissions = []
+        url = self.start_url
+        page_count = 0
+        while url:
+            html, _ = self.crawler.http_client.fetch(url, use_cache=False)
+            page, next_url = self.crawler.parser.parse(html)
+            submissions.extend(page)
+            page_count += 1
+
+            if not page or not next_url:
+                break
+            known_max = self.binner.known_max_id
+            if known_max is None:
+                oldest_ts = min((s.submitted_ts for s in page if s.submitted_ts is not None), default=None)
+                if oldest_ts is not None and oldest_ts < datetime_to_timestamp(self.builder.time_range.start):
+                    break
+                if page_count == self.max_catchup_pages:
+                    self._log(f"[실시간] 이전 기록이 없어 시작 시각까지 {page_count}페이지를 넘어 계속 가져옵니다.")
+                url = next_url
+                continue
+            ids = [s.submission_id for s in page if s.submission_id is not None]
+            oldest_pending = self.binner.oldest_pending()
+            reached_known = any(submission_id <= known_max for submission_id in ids)
+            if reached_known and (oldest_pending is None or min(ids) <= oldest_pending):
+                break
+
+            if page_count >= self.max_catchup_pages:
+                if reached_known:
+                    self._log(f"[경고] {page_count}페이지까지만 확인했습니다. "
+                              f"제출 번호 {oldest_pending} 이후 채점 중 제출은 다음 폴링에서 갱신합니다.")
+                    break
+                if page_count == self.max_catchup_pages:
+                    self._log(f"[경고] 새 제출이 {page_count}페이지를 넘어 마지막 제출 번호 {known_max}까지 "
+                              f"계속 가져옵니다.")
+            url = next_url
+        return submissions
+
+    def _render(self, problems: List[str]) -> List[str]:
+        params = self.builder.render_params()
+        rendered = []
+        for problem_no in problems:
+            bin_starts, counts = self.binner.compact(problem_no)
+            output_path = self.builder.problem_output_path(problem_no)
+            digest = RenderManifest.digest(bin_starts, counts, params)
+            if self.manifest.is_current(output_path, digest):
+                continue
+            self.renderer.render(BinnedCounts.to_dict(bin_starts, counts), self.builder.time_range, output_path)
+            self.manifest.update(output_path, digest)
+            rendered.append(problem_no)
+
+        if rendered:
+            self.manifest.save()
+        return rendered
@@ -0,0 +1,98 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Callable
+from urllib.parse import urlsplit, parse_qsl
+
+from domain import Submission
+from .cache import CacheStrategy, CompressedCacheStrategy, FileCacheStrategy, SqliteCacheStrategy
+from .crawler import StatusPageParser, LxmlStatusPageParser
+from .jsonl import JsonlWriter
+
+_worker_cache: Optional[CacheStrategy] = None
+_worker_parser: Optional[StatusPageParser] = None
+
+
+def _create_cache(cache_type: str, cache_location: str) -> CacheStrategy:
+    if cache_type == 'file':
+        return FileCacheStrategy(cache_location)
+    if cache_type == 'compressed':
+        return CompressedCacheStrategy(cache_location, head_ttl=None, page_ttl=None, max_bytes=None)
+    if cache_type == 'sqlite':
+        return SqliteCacheStrategy(cache_location)
+    raise ValueError(f"Unsupported cache type for reparse: {cache_type}")
+
+
+def _create_parser(parser_backend: str) -> StatusPageParser:
+    return LxmlStatusPageParser() if parser_backend == 'lxml' else StatusPageParser()
+
+
+def _init_worker(cache_type: str, cache_location: str, parser_backend: str):
+    global _worker_cache, _worker_parser
+    _worker_cache = _create_cache(cache_type, cache_location)
+    _worker_parser = _create_parser(parser_backend)
+
+
+def _parse_cached_page(url: str) -> List[Submission]:
+    html = _worker_cache.get(url)
+    if not html:
+        return []
+    submissions, _ = _worker_parser.parse(html)
+    return submissions
+
+
+class CacheReparser:
+    def __init__(self, cache_type: str = 'file', cache_location: str = 'cache',
+                 parser_backend: str = 'bs4', workers: Optional[int] = None):
+        self.cache_type = cache_type
+        self.cache_location = cache_location
+        self.parser_backend = parser_backend
+        self.workers = workers or os.cpu_count() or 1
+        self.progress_callback: Optional[Callable[[str], None]] = None
+
+    def set_progress_callback(self, callback: Callable[[str], None]):
+        self.progress_callback = callback
+
+    def _log(self, message: str):
+        if self.progress_callback:
+            self.progress_callback(message)
+
+    def find_pages(self, contest_id: str) -> List[str]:
+        cache = _create_cache(self.cache_type, self.cache_location)
+        return sorted(url for url in cache.keys() if self._is_contest_status_page(url, contest_id))
+
+    @staticmethod
+    def _is_contest_status_page(url: str, contest_id: str) -> bool:
+        parts = urlsplit(url)
+        if not parts.path.rstrip('/').endswith('/status'):
+            return False
+        return dict(parse_qsl(parts.query)).get('contest_id') == str(contest_id)
+
+    def reparse(self, contest_id: str, output_path: str) -> int:
+        started_at = time.time()
+        pages = self.find_pages(contest_id)
+        if not pages:
+            raise ValueError(f"캐시에서 대회 {contest_id}의 상태 페이지를 찾을 수 없습니다.")
+
+        self._log(f"[재파싱] 페이지: {len(pages)}개, 프로세스: {self.workers}개")
+
+        by_id = {}
+        chunksize = max(1, len(pages) // (self.workers * 8))
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.cache_type, self.cache_location, self.parser_backend)
+        ) as executor:
+            for index, submissions in enumerate(executor.map(_parse_cached_page, pages, chunksize=chunksize), 1):
+                for submission in submissions:
+                    if submission.submission_id is not None:
+                        by_id[submission.submission_id] = submission
+                if index % 100 == 0 or index == len(pages):
+                    self._log(f"[파싱 완료] 페이지: {index}/{len(pages)}, 레코드: {len(by_id)}개")
+
+        with JsonlWriter(output_path, atomic=True) as out:
+            out.write_batch(by_id[submission_id] for submission_id in sorted(by_id, reverse=True))
+
+        elapsed = time.time() - started_at
+        self._log(f"[완료] 레코드: {len(by_id)}개, 경과시간: {elapsed:.2f}초")
+        return len(by_id)
@@ -0,0 +1,131 @@
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+import pytest
+
+from services import crawler as crawler_module
+from services.cache import NoCacheStrategy
+from services.crawler import BojCrawler, ConcurrentBojCrawler, HttpClient, StatusPageParser
+
+PAGE_SIZE = 20
+
+ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{submission_id}</td>'
+    '<td><a href="/user/{user_id}">{user_id}</a></td>'
+    '<td><a href="/contest/problem/1/{problem_no}">{problem_no}</a></td>'
+    '<td><span class="result-text">{result}</span></td>'
+    '<td>{memory_kb}</td>'
+    '<td>{time_ms}</td>'
+    '<td><a href="/source/{submission_id}">Python 3</a></td>'
+    '<td>{code_length}</td>'
+    '<td><a title="{submitted_at}">1분 전</a></td>'
+    '</tr>'
+)
+
+RESULTS = ('맞았습니다!!', '틀렸습니다', '시간 초과', '컴파일 에러')
+
+
+def record_status_pages():
+    rng = random.Random(1379)
+    submission_ids = sorted(rng.sample(range(100000, 101200), 233), reverse=True)
+    rows = {}
+    for index, submission_id in enumerate(submission_ids):
+        rows[submission_id] = ROW_TEMPLATE.format(
+            submission_id=submission_id,
+            user_id=f'user{rng.randrange(30)}',
+            problem_no=rng.choice('ABCDEFG'),
+            result=rng.choice(RESULTS),
+            memory_kb=rng.randrange(1000, 64000),
+            time_ms=rng.randrange(0, 2000),
+            code_length=rng.randrange(100, 5000),
+            submitted_at=f'2024-09-28 {19 + index // 100}:{index % 60:02d}:00',
+        )
+    return rows
+
+
+class StubStatusServer:
+    def __init__(self, rows, overlap=0):
+        self.rows = rows
+        self.overlap = overlap
+        self.ids = sorted(rows, reverse=True)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}'
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def page(self, top):
+        page_ids = [i for i in self.ids if top is None or i <= top][:PAGE_SIZE]
+        body = ''.join(self.rows[i] for i in page_ids)
+        next_link = ''
+        if page_ids and page_ids[-1] > self.ids[-1]:
+            next_link = (f'<a id="next_page" href="{self.base_url}/status?contest_id=1'
+                         f'&top={page_ids[-1 - self.overlap] - 1}">다음 페이지</a>')
+        return (f'<html><body><table id="status-table"><tbody>{body}</tbody></table>'
+                f'{next_link}</body></html>')
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = dict(parse_qsl(urlsplit(self.path).query))
+                top = int(query['top']) if 'top' in query else None
+                payload = stub.page(top).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    monkeypatch.setattr(crawler_module.time, 'sleep', lambda seconds: None)
+    with StubStatusServer(record_status_pages()) as server:
+        yield server
+
+
+def crawl(crawler_class, server, output_path, **kwargs):
+    http_client = HttpClient('test-cookie', NoCacheStrategy())
+    try:
+        crawler_class(http_client, StatusPageParser(), **kwargs).crawl(
+            f'{server.base_url}/status?contest_id=1', str(output_path)
+        )
+    finally:
+        http_client.close()
+    with open(output_path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.mark.parametrize('workers', [2, 3, 8])
+def test_concurrent_crawl_matches_sequential(stub_server, tmp_path, workers):
+    sequential = crawl(BojCrawler, stub_server, tmp_path / 'sequential.jsonl')
+    concurrent = crawl(ConcurrentBojCrawler, stub_server, tmp_path / 'concurrent.jsonl', workers=workers)
+
+    assert len(sequential) == len(stub_server.ids)
+    assert concurrent == sequential
+
+
+def test_concurrent_crawl_deduplicates_shifted_pages(monkeypatch, tmp_path):
+    monkeypatch.setattr(crawler_module.time, 'sleep', lambda seconds: None)
+    with StubStatusServer(record_status_pages(), overlap=3) as server:
+        rows = crawl(ConcurrentBojCrawler, server, tmp_path / 'concurrent.jsonl', workers=4)
+    submission_ids = [row['submission_id'] for row in rows]
+
+    assert submission_ids == server.ids